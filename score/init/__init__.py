@@ -29,26 +29,33 @@
 from .exceptions import (
     InitializationError, ConfigurationError, DependencyLoop)
 
-from .dependency import DependencySolver
+from .dependency import DependencySolver, DependencySchedule
 
 from .initializer import (
-    init, init_from_file, init_logging_from_file,
-    ConfiguredModule, ConfiguredScore)
+    init, init_async, init_prefork, init_from_file, init_logging_from_file,
+    critical_path, ConfiguredModule, ConfiguredScore)
+
+from .report import InitReport, ModuleReport
+
+from .plan import compile_plan, init_from_plan
 
 from .config import (
     parse_bool, parse_datetime, parse_time_interval, parse_dotted_path,
     parse_call, parse_list, parse_host_port, parse_object, parse_json,
-    init_object, init_cache_folder, extract_conf, parse_config_file)
+    init_object, init_cache_folder, extract_conf, parse_config_file,
+    ConfigView, SectionView)
 
 from .autoimport import import_from_submodules
 
 __version__ = '0.8.1'
 
 __all__ = (
-    'init', 'init_from_file', 'init_logging_from_file', 'InitializationError',
-    'ConfigurationError', 'DependencySolver', 'DependencyLoop',
-    'ConfiguredModule', 'ConfiguredScore', 'parse_bool', 'parse_datetime',
-    'parse_time_interval', 'parse_dotted_path', 'parse_call', 'parse_list',
-    'parse_host_port', 'parse_object', 'parse_json', 'init_object',
-    'init_cache_folder', 'extract_conf', 'parse_config_file',
-    'import_from_submodules')
+    'init', 'init_async', 'init_prefork', 'init_from_file', 'compile_plan',
+    'init_from_plan', 'init_logging_from_file', 'critical_path',
+    'InitializationError', 'ConfigurationError', 'DependencySolver',
+    'DependencySchedule', 'DependencyLoop', 'ConfiguredModule',
+    'ConfiguredScore', 'InitReport', 'ModuleReport', 'parse_bool',
+    'parse_datetime', 'parse_time_interval', 'parse_dotted_path', 'parse_call',
+    'parse_list', 'parse_host_port', 'parse_object', 'parse_json',
+    'init_object', 'init_cache_folder', 'extract_conf', 'parse_config_file',
+    'ConfigView', 'SectionView', 'import_from_submodules')
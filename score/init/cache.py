@@ -0,0 +1,166 @@
+# vim: set fileencoding=UTF-8
+# Copyright © 2015-2018 STRG.AT GmbH, Vienna, Austria
+#
+# This file is part of the The SCORE Framework.
+#
+# The SCORE Framework and all its parts are free software: you can redistribute
+# them and/or modify them under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation which is in the
+# file named COPYING.LESSER.txt.
+#
+# The SCORE Framework and all its parts are distributed without any WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. For more details see the GNU Lesser General Public
+# License.
+#
+# If you have not received a copy of the GNU Lesser General Public License see
+# http://www.gnu.org/licenses/.
+#
+# The License-Agreement realised between you as Licensee and STRG.AT GmbH as
+# Licenser including the issue of its valid conclusion and its pre- and
+# post-contractual effects is governed by the laws of Austria. Any disputes
+# concerning this License-Agreement including the issue of its valid conclusion
+# and its pre- and post-contractual effects are exclusively decided by the
+# competent court, in whose district STRG.AT GmbH has its registered seat, at
+# the discretion of STRG.AT GmbH also the competent court, in whose district the
+# Licensee has his registered seat, an establishment or assets.
+
+from inspect import signature, unwrap, Parameter
+import json
+import logging
+import os
+
+
+log = logging.getLogger(__name__)
+
+
+class DependencyCache:
+    """
+    A persistent cache of the dependencies declared through the signatures of
+    ``init`` and ``_finalize`` functions, stored as JSON in given *file*. Each
+    entry is keyed by the qualified name of the function and is only valid as
+    long as the path, modification time and size of the file containing the
+    function remain the same.
+
+    If *file* is `None`, nothing is persisted and the signatures are
+    inspected on every call.
+    """
+
+    def __init__(self, file=None):
+        self.file = file
+        self._entries = dict()
+        self._dirty = False
+        if file is None:
+            return
+        try:
+            with open(file) as fp:
+                self._entries = json.load(fp)
+        except (OSError, ValueError):
+            pass
+
+    def dependencies(self, func, skip=0):
+        """
+        Returns the parameters of given *func* as a list of tuples, each
+        containing the name of the parameter and a boolean indicating whether
+        the parameter has a default value (i.e. whether the dependency is
+        optional). The first *skip* parameters are ignored.
+        """
+        try:
+            # the signature of decorated functions is read from the wrapped
+            # function, so the fingerprint must be that of its file, too
+            code = unwrap(func).__code__
+            key = '%s:%s:%d' % (func.__module__, func.__qualname__, skip)
+            stat = os.stat(code.co_filename)
+        except (AttributeError, OSError):
+            return _inspect(func, skip)
+        fingerprint = [code.co_filename, stat.st_mtime, stat.st_size]
+        entry = self._entries.get(key)
+        if entry is not None and entry['file'] == fingerprint:
+            return [tuple(dependency) for dependency in entry['dependencies']]
+        dependencies = _inspect(func, skip)
+        if self.file is not None:
+            self._entries[key] = {
+                'file': fingerprint,
+                'dependencies': dependencies,
+            }
+            self._dirty = True
+        return dependencies
+
+    def save(self):
+        """
+        Writes the cache to its file, if it was modified.
+        """
+        if not self._dirty:
+            return
+        if _dump(self._entries, self.file, 'dependency cache'):
+            self._dirty = False
+
+
+class TimingCache:
+    """
+    A persistent record of the time each module's ``init`` function took
+    during the most recent initialization, stored as JSON in given *file*.
+    The member *durations* maps module aliases to their durations in
+    seconds.
+
+    If *file* is `None`, the durations are only kept in memory.
+    """
+
+    def __init__(self, file=None):
+        self.file = file
+        self.durations = dict()
+        self._dirty = False
+        if file is None:
+            return
+        try:
+            with open(file) as fp:
+                self.durations = json.load(fp)
+        except (OSError, ValueError):
+            pass
+
+    def update(self, report):
+        """
+        Stores the init durations of all modules in given
+        :class:`.InitReport`.
+        """
+        for alias, module in report.modules.items():
+            if module.init_time is None:
+                continue
+            self.durations[alias] = module.init_time
+            self._dirty = True
+
+    def save(self):
+        """
+        Writes the durations to the file, if they were modified.
+        """
+        if not self._dirty or self.file is None:
+            return
+        if _dump(self.durations, self.file, 'timing cache'):
+            self._dirty = False
+
+
+def _dump(data, file, description):
+    """
+    Atomically writes given *data* as JSON to *file*. Logs a warning
+    mentioning the *description* of the file and returns `False` if that
+    fails.
+    """
+    tmpfile = '%s.%d' % (file, os.getpid())
+    try:
+        with open(tmpfile, 'w') as fp:
+            json.dump(data, fp)
+        os.replace(tmpfile, file)
+    except OSError as e:
+        log.warning('Could not write %s %s: %s' % (description, file, e))
+        return False
+    return True
+
+
+def _inspect(func, skip):
+    dependencies = []
+    sig = signature(func)
+    for i, (param_name, param) in enumerate(sig.parameters.items()):
+        if i < skip:
+            continue
+        dependencies.append((param_name, param.default != Parameter.empty))
+    return dependencies
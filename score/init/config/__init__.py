@@ -32,8 +32,11 @@ from .helpers import (
 
 from .parser import parse as parse_config_file
 
+from .view import ConfigView, SectionView
+
 
 __all__ = (
     'parse_bool', 'parse_datetime', 'parse_time_interval', 'parse_dotted_path',
     'parse_call', 'parse_list', 'parse_host_port', 'parse_object', 'parse_json',
-    'init_object', 'init_cache_folder', 'extract_conf', 'parse_config_file')
+    'init_object', 'init_cache_folder', 'extract_conf', 'parse_config_file',
+    'ConfigView', 'SectionView')
@@ -26,12 +26,14 @@
 # Licensee has his registered seat, an establishment or assets.
 
 from collections import OrderedDict
+from collections.abc import Mapping
 import configparser
 import os
 import re
 import warnings
 from ..exceptions import ConfigurationError
 from .helpers import parse_list
+from .view import ConfigView
 import logging
 from glob import glob
 
@@ -39,9 +41,19 @@ from glob import glob
 log = logging.getLogger(__name__)
 
 
-def parse(file, *, recurse=True, return_configparser=False):
+def parse(file, *, recurse=True, return_configparser=False, listener=None):
     """
-    Reads a configuration file and returns a nested `dict`.
+    Reads a configuration file and returns a read-only :class:`.ConfigView`
+    of its sections, or the :class:`configparser.ConfigParser` itself, if
+    *return_configparser* is `True`. Interpolated values are only resolved
+    once, the first time they are accessed.
+
+    .. note::
+
+        Earlier versions returned an `OrderedDict` of `OrderedDict` objects,
+        which could be modified. The :class:`.ConfigView` is read-only:
+        callers adjusting the configuration must copy it into a `dict` first,
+        or pass their adjustments as the *overrides* of :func:`.init`.
 
     The main feature of this function is the support for "adjustment files",
     i.e. files that do not actually define all values, but define deviations
@@ -157,23 +169,68 @@ def parse(file, *, recurse=True, return_configparser=False):
         |foo     |-bar      |foo
         |bar  +  |+baz  =>  |baz
 
+    The optional *listener* is called with the
+    :class:`configparser.ConfigParser` of every file right after the file was
+    read, before its bases and includes are processed. This allows acting on
+    values, like the list of modules, while the rest of the configuration is
+    still being parsed.
     """
-    parser = _parse(file, [], recurse)
+    parser = _parse(file, [], recurse, listener)
     if return_configparser:
         return parser
-    result = OrderedDict()
-    for section in parser:
-        if section in ('DEFAULT'):
-            continue
-        result[section] = OrderedDict()
-        for k, v in parser[section].items():
-            if k in ('here', 'cwd') and parser['DEFAULT'][k] == v:
-                continue
-            result[section][k] = v
-    return result
+    return ConfigView(_ParsedConfig(parser))
+
+
+class _ParsedConfig(Mapping):
+    """
+    The sections of a *parser* created by :func:`parse`, without the
+    ``DEFAULT`` section.
+    """
+
+    def __init__(self, parser):
+        self._parser = parser
+
+    def __getitem__(self, name):
+        if name == 'DEFAULT':
+            raise KeyError(name)
+        return _ParsedSection(self._parser[name])
+
+    def __iter__(self):
+        return iter(self._parser.sections())
+
+    def __len__(self):
+        return len(self._parser.sections())
+
+
+class _ParsedSection(Mapping):
+    """
+    A *section* of a :class:`configparser.ConfigParser` created by
+    :func:`parse`, without the values ``here`` and ``cwd``, unless the
+    section overrides them.
+    """
+
+    def __init__(self, section):
+        self._section = section
+
+    def __getitem__(self, key):
+        value = self._section[key]
+        if key in ('here', 'cwd') and \
+                self._section.parser['DEFAULT'][key] == value:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key in self._section:
+            if key not in ('here', 'cwd') or \
+                    self._section.parser['DEFAULT'][key] != \
+                    self._section[key]:
+                yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
 
 
-def _parse(file, visited, recurse=True):
+def _parse(file, visited, recurse=True, listener=None):
     """
     Helper function for :func:`parse`, needed for hiding the *visited*
     parameter in the public API. The purpose of that parameter is to prevent
@@ -189,15 +246,18 @@ def _parse(file, visited, recurse=True):
         settings['DEFAULT']['here'] = settings['DEFAULT']['cwd']
     with open(file) as fp:
         settings.read_file(fp)
+    if listener is not None:
+        listener(settings)
     if not recurse or 'score.init' not in settings:
         return settings
     files = []
     visited.append(os.path.abspath(file))
     if 'based_on' in settings['score.init']:
-        settings = _parse_bases(file, visited, settings, files)
+        settings = _parse_bases(file, visited, settings, files, listener)
         del settings['score.init']['based_on']
     if 'include' in settings['score.init']:
-        settings = _parse_includes(file, visited, settings, files)
+        settings = _parse_includes(
+            file, visited, settings, files, listener)
         del settings['score.init']['include']
     visited.pop()
     try:
@@ -208,7 +268,7 @@ def _parse(file, visited, recurse=True):
     return settings
 
 
-def _parse_bases(file, visited, settings, files):
+def _parse_bases(file, visited, settings, files, listener=None):
     """
     Handles the ``score.init/based_on`` key in the parsed *settings* of given
     configuration *file*. Will add all encountered bases to the list of *files*
@@ -232,13 +292,13 @@ def _parse_bases(file, visited, settings, files):
                 score.init,
                 'Configuration file loop:\n - ' + '\n - '.join(visited))
         files.append(base)
-        bases.append(_parse(base, visited))
+        bases.append(_parse(base, visited, listener=listener))
     settings = _merge_settings(*bases)
     _apply_adjustments(file, settings, adjustments)
     return settings
 
 
-def _parse_includes(file, visited, settings, files):
+def _parse_includes(file, visited, settings, files, listener=None):
     """
     Handles the ``score.init/include`` key in the parsed *settings* of given
     configuration *file*. Will add all encountered bases to the list of *files*
@@ -251,7 +311,8 @@ def _parse_includes(file, visited, settings, files):
         return settings
     for include_declaration in parse_list(includes):
         for include_file in glob(include_declaration):
-            include = _parse(include_file, visited, recurse=False)
+            include = _parse(include_file, visited, recurse=False,
+                             listener=listener)
             try:
                 if include['score.init']['based_on']:
                     import score.init
@@ -0,0 +1,193 @@
+# vim: set fileencoding=UTF-8
+# Copyright © 2015-2018 STRG.AT GmbH, Vienna, Austria
+#
+# This file is part of the The SCORE Framework.
+#
+# The SCORE Framework and all its parts are free software: you can redistribute
+# them and/or modify them under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation which is in the
+# file named COPYING.LESSER.txt.
+#
+# The SCORE Framework and all its parts are distributed without any WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. For more details see the GNU Lesser General Public
+# License.
+#
+# If you have not received a copy of the GNU Lesser General Public License see
+# http://www.gnu.org/licenses/.
+#
+# The License-Agreement realised between you as Licensee and STRG.AT GmbH as
+# Licenser including the issue of its valid conclusion and its pre- and
+# post-contractual effects is governed by the laws of Austria. Any disputes
+# concerning this License-Agreement including the issue of its valid conclusion
+# and its pre- and post-contractual effects are exclusively decided by the
+# competent court, in whose district STRG.AT GmbH has its registered seat, at
+# the discretion of STRG.AT GmbH also the competent court, in whose district the
+# Licensee has his registered seat, an establishment or assets.
+
+from collections.abc import Mapping
+
+
+class ConfigView(Mapping):
+    """
+    A read-only view of a two-dimensional configuration, i.e. a mapping of
+    section names to mappings of keys to values. The view consists of any
+    number of such mappings, the *layers*, which may also be
+    :class:`configparser.ConfigParser` objects. The values of later layers
+    take precedence over those of earlier ones.
+
+    The layers are neither copied nor modified and must not be modified while
+    the view is in use: each value is retrieved from its layer only once and
+    then remembered. The interpolation of values in a
+    :class:`configparser.ConfigParser` thus happens at most once, too, no
+    matter how many consumers access the value.
+
+    The sections of the view are :class:`.SectionView` objects.
+    """
+
+    def __init__(self, *layers):
+        self._layers = layers
+        self._sections = {}
+        self._names = None
+        self._subsections = None
+
+    def layer(self, *layers):
+        """
+        Returns a new view, that contains the given *layers* on top of this
+        view. The values already retrieved by this view are shared with the
+        new view.
+        """
+        return ConfigView(self, *layers)
+
+    def subsections(self, name):
+        """
+        Returns the names of all sub-sections of the section with given
+        *name*, i.e. all sections whose name starts with *name* followed by a
+        colon, like ``score.db:engine``. The sub-sections of all sections are
+        indexed in a single pass over the section names on the first call.
+        """
+        if self._subsections is None:
+            index = {}
+            for section in self:
+                prefix, colon, _ = section.partition(':')
+                if colon:
+                    index.setdefault(prefix, []).append(section)
+            self._subsections = index
+        return list(self._subsections.get(name, ()))
+
+    def __getitem__(self, name):
+        try:
+            return self._sections[name]
+        except KeyError:
+            pass
+        sections = [layer[name] for layer in self._layers if name in layer]
+        if not sections:
+            raise KeyError(name)
+        if len(sections) == 1 and isinstance(sections[0], SectionView):
+            section = sections[0]
+        else:
+            section = SectionView(*sections)
+        self._sections[name] = section
+        return section
+
+    def __iter__(self):
+        if self._names is None:
+            self._names = _merge_keys(self._layers)
+        return iter(self._names)
+
+    def __len__(self):
+        if self._names is None:
+            self._names = _merge_keys(self._layers)
+        return len(self._names)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__,
+                           dict((name, dict(section))
+                                for name, section in self.items()))
+
+
+class SectionView(Mapping):
+    """
+    A read-only view of a single section of a :class:`.ConfigView`, which
+    consists of the *layers* of that section. See :class:`.ConfigView` for
+    details.
+    """
+
+    def __init__(self, *layers):
+        self._layers = layers
+        self._values = {}
+        self._keys = None
+
+    def layer(self, *layers):
+        """
+        Returns a new view, that contains the given *layers* on top of this
+        view.
+        """
+        return SectionView(self, *layers)
+
+    def prefixed(self, prefix):
+        """
+        Returns a view of this section, where each key is prefixed with given
+        *prefix*.
+        """
+        return SectionView(_PrefixedMapping(self, prefix))
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        for layer in reversed(self._layers):
+            try:
+                value = layer[key]
+            except KeyError:
+                continue
+            self._values[key] = value
+            return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        if self._keys is None:
+            self._keys = _merge_keys(self._layers)
+        return iter(self._keys)
+
+    def __len__(self):
+        if self._keys is None:
+            self._keys = _merge_keys(self._layers)
+        return len(self._keys)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, dict(self.items()))
+
+
+class _PrefixedMapping(Mapping):
+    """
+    A mapping exposing the values of another *mapping* with each of its keys
+    prefixed with given *prefix*.
+    """
+
+    def __init__(self, mapping, prefix):
+        self._mapping = mapping
+        self._prefix = prefix
+
+    def __getitem__(self, key):
+        if not key.startswith(self._prefix):
+            raise KeyError(key)
+        return self._mapping[key[len(self._prefix):]]
+
+    def __iter__(self):
+        return (self._prefix + key for key in self._mapping)
+
+    def __len__(self):
+        return len(self._mapping)
+
+
+def _merge_keys(layers):
+    """
+    Returns the list of all keys of given *layers* in the order of their
+    first appearance.
+    """
+    keys = {}
+    for layer in layers:
+        keys.update(dict.fromkeys(layer))
+    return list(keys)
@@ -24,6 +24,11 @@
 # competent court, in whose district STRG.AT GmbH has its registered seat, at
 # the discretion of STRG.AT GmbH also the competent court, in whose district the
 # Licensee has his registered seat, an establishment or assets.
+from array import array
+from collections import deque
+from itertools import accumulate, chain, compress
+from operator import sub
+
 from .exceptions import DependencyLoop
 
 
@@ -41,7 +46,52 @@ class DependencySolver:
     """
 
     def __init__(self):
-        self._dependencies = dict()
+        # every node is interned to an integer id on first sight. The
+        # remaining members are indexed by these ids. The lists of
+        # dependencies and dependents are the actual graph, the _CompactGraph
+        # is a snapshot of them, that is created for solving the graph.
+        self._ids = dict()
+        self._names = []
+        self._declared = []
+        self._is_declared = bytearray()
+        self._dependencies = []
+        self._dependents = []
+        self._invalidate()
+
+    def _invalidate(self):
+        """
+        Drops all cached information derived from the dependency graph. Must be
+        called whenever the graph changes.
+        """
+        self._graph = None
+        self._order = None
+        self._solution = None
+        self._closures = None
+
+    def _intern(self, node):
+        """
+        Returns the integer id of given *node*, registering it if necessary.
+        """
+        try:
+            return self._ids[node]
+        except KeyError:
+            pass
+        id_ = self._ids[node] = len(self._names)
+        self._names.append(node)
+        self._is_declared.append(0)
+        self._dependencies.append([])
+        self._dependents.append([])
+        return id_
+
+    def _declared_id(self, node):
+        """
+        Returns the integer id of given *node*, if it was registered as the
+        *from_* argument of :meth:`add_dependency`, or `None` otherwise.
+        """
+        id_ = self._ids.get(node)
+        if id_ is None or not self._is_declared[id_]:
+            return None
+        return id_
 
     def add_dependency(self, from_, to=None):
         """
@@ -49,10 +99,18 @@ class DependencySolver:
         dependencies, you can still register it without a *to* argument to
         ensure that it is included in the result set of the solve() call.
         """
-        if from_ not in self._dependencies:
-            self._dependencies[from_] = set()
-        if to is not None:
-            self._dependencies[from_].add(to)
+        from_id = self._intern(from_)
+        if not self._is_declared[from_id]:
+            self._is_declared[from_id] = 1
+            self._declared.append(from_id)
+            self._invalidate()
+        if to is None:
+            return
+        to_id = self._intern(to)
+        if to_id not in self._dependencies[from_id]:
+            self._dependencies[from_id].append(to_id)
+            self._dependents[to_id].append(from_id)
+            self._invalidate()
 
     add = add_dependency
 
@@ -61,9 +119,13 @@ class DependencySolver:
         Removes a direct dependency. Does nothing, if there was no such
         dependency.
         """
-        if from_ not in self._dependencies:
+        from_id = self._declared_id(from_)
+        to_id = self._ids.get(to)
+        if from_id is None or to_id not in self._dependencies[from_id]:
             return
-        self._dependencies[from_].difference_update({to})
+        self._dependencies[from_id].remove(to_id)
+        self._dependents[to_id].remove(from_id)
+        self._invalidate()
 
     def direct_dependencies(self, node):
         """
@@ -75,9 +137,11 @@ class DependencySolver:
         """
         Same as :meth:`direct_dependencies`, but returns an iterator.
         """
-        if node not in self._dependencies:
+        id_ = self._declared_id(node)
+        if id_ is None:
             return
-        yield from self._dependencies[node]
+        for other in self._dependencies[id_]:
+            yield self._names[other]
 
     def direct_dependents(self, node):
         """
@@ -89,51 +153,429 @@ class DependencySolver:
         """
         Same as :meth:`direct_dependents`, but returns an iterator.
         """
-        if node not in self._dependencies:
+        id_ = self._ids.get(node)
+        if id_ is None:
             return
-        for other, other_deps in self._dependencies.items():
-            if other == node or node not in other_deps:
-                continue
-            yield other
+        for other in self._dependents[id_]:
+            if other != id_:
+                yield self._names[other]
 
     def has_direct_dependency(self, from_, to):
         """
         Tests, if given node *from_* has a direct dependency to node *to*.
         """
-        return from_ in self._dependencies and to in self._dependencies[from_]
+        from_id = self._declared_id(from_)
+        return from_id is not None and \
+            self._ids.get(to) in self._dependencies[from_id]
+
+    def transitive_dependencies(self, node):
+        """
+        Provides all nodes, that given *node* depends on, either directly or
+        indirectly. The nodes are returned in the order in which they would
+        appear in the result of :meth:`solve`.
+
+        The transitive closure of the whole graph is computed on the first
+        call and re-used until the graph changes. Will raise a
+        :class:`.DependencyLoop` if the graph contains a loop.
+        """
+        return self._query_closure(node, 0)
+
+    def transitive_dependents(self, node):
+        """
+        Provides all nodes, that depend on given *node*, either directly or
+        indirectly. See :meth:`transitive_dependencies` for details.
+        """
+        return self._query_closure(node, 1)
+
+    def _query_closure(self, node, direction):
+        """
+        Helper function for :meth:`transitive_dependencies` and
+        :meth:`transitive_dependents`. Decodes the bitset of given *node* in
+        the closure with given *direction* (0 for dependencies, 1 for
+        dependents).
+        """
+        closures = self._get_closures()
+        position = self._get_graph().position(node)
+        if position is None:
+            return []
+        bits = closures[direction][position]
+        sorted_ = self._solution
+        result = []
+        while bits:
+            lowest = bits & -bits
+            result.append(sorted_[lowest.bit_length() - 1])
+            bits ^= lowest
+        return result
+
+    def _get_closures(self):
+        """
+        Computes the transitive closures of all nodes, if necessary. The
+        closures are stored as integer bitsets, where the bit at position *n*
+        stands for the *n*-th node in the result of :meth:`solve`. The return
+        value is a tuple containing two lists, which contain the bitsets of the
+        dependencies and dependents of each node of the compact graph.
+        """
+        if self._closures is not None:
+            return self._closures
+        self.solve()
+        graph = self._graph
+        order = self._order
+        rank = array('l', [0]) * len(graph.included)
+        for i, position in enumerate(order):
+            rank[position] = i
+        dependencies = [0] * len(graph.included)
+        for position in order:
+            bits = 0
+            for dep in graph.dependencies(position):
+                bits |= dependencies[dep] | (1 << rank[dep])
+            dependencies[position] = bits
+        dependents = [0] * len(graph.included)
+        for position in reversed(order):
+            bits = 0
+            for other in graph.dependents(position):
+                bits |= dependents[other] | (1 << rank[other])
+            dependents[position] = bits
+        self._closures = (dependencies, dependents)
+        return self._closures
+
+    def _get_graph(self):
+        """
+        Returns the :class:`_CompactGraph` of the current dependency graph,
+        creating it if necessary.
+        """
+        if self._graph is None:
+            self._graph = _CompactGraph(self)
+        return self._graph
 
     def solve(self):
         """
         Solves the dependency system.
+
+        This function does not modify the solver and the result is cached until
+        the next change to the dependency graph, so it is cheap to call this
+        function repeatedly. Each call returns a new list, though, which may be
+        modified freely by the caller.
+
+        The result is computed with Kahn's algorithm, i.e. in time linear to
+        the number of nodes and dependencies. Nodes, that were only ever
+        registered as the *to* argument of :meth:`add_dependency`, are part of
+        the result, too.
+        """
+        if self._solution is None:
+            self._solution = self._solve()
+        if isinstance(self._solution, DependencyLoop):
+            raise DependencyLoop(self._solution.loop,
+                                 loops=self._solution.loops)
+        return list(self._solution)
+
+    def _solve(self):
+        """
+        Performs the actual work of :meth:`solve`. Returns either the sorted
+        list of nodes, or a :class:`.DependencyLoop` describing the loop that
+        prevented sorting. Also stores the sorted positions of the compact
+        graph as *_order*.
+        """
+        graph = self._get_graph()
+        remaining = graph.dependency_counts()
+        queue = deque(position for position in graph.nodes
+                      if not remaining[position])
+        order = array('l')
+        offsets, targets = graph._dependents
+        while queue:
+            position = queue.popleft()
+            order.append(position)
+            for other in targets[offsets[position]:offsets[position + 1]]:
+                count = remaining[other] - 1
+                remaining[other] = count
+                if not count:
+                    queue.append(other)
+        if len(order) != len(graph):
+            loops = self._find_loops(graph, remaining)
+            loop = self._find_loop(graph, loops[0])
+            return DependencyLoop(
+                [graph.names[position] for position in loop],
+                loops=[[graph.names[position] for position in component]
+                       for component in loops])
+        self._order = order
+        return [graph.names[position] for position in order]
+
+    def solve_levels(self):
+        """
+        Solves the dependency system like :meth:`solve`, but groups the result
+        into levels: Each level is a list of nodes, whose dependencies are all
+        part of earlier levels. The nodes within a single level can thus be
+        processed concurrently.
+        """
+        schedule = self.schedule()
+        levels = []
+        level = schedule.ready()
+        while level:
+            levels.append(level)
+            level = [node for done in level for node in schedule.done(done)]
+        return levels
+
+    def remaining_path_lengths(self, weights):
+        """
+        Computes the length of the longest path starting at each node and
+        following its dependents, where the length of a path is the sum of
+        the *weights* of its nodes. Nodes missing in the `dict` of *weights*
+        have a weight of zero. Returns a `dict` mapping each node to its
+        length. Will raise a :class:`.DependencyLoop` if the graph contains a
+        loop.
+
+        Processing nodes with a longer remaining path first keeps the longest
+        chain of dependencies from becoming the bottleneck of a concurrent
+        processing.
+        """
+        nodes = self.solve()
+        graph = self._get_graph()
+        lengths = {}
+        for node in reversed(nodes):
+            longest = 0
+            for other in graph.dependents(graph.position(node)):
+                longest = max(longest, lengths[graph.names[other]])
+            lengths[node] = weights.get(node, 0) + longest
+        return lengths
+
+    def critical_path(self, weights):
         """
-        sorted_ = []
-        dependencies = dict()
-        for item, item_dependencies in self._dependencies.items():
-            if not item_dependencies:
-                sorted_.append(item)
-            else:
-                dependencies[item] = item_dependencies
-                for dep in item_dependencies:
-                    if dep not in self._dependencies:
-                        sorted_.append(dep)
-        updated = True
-        while updated:
-            updated = False
-            for item in list(dependencies.keys()):
-                deps = dependencies[item]
-                to_remove = deps.intersection(sorted_)
-                if not to_remove:
-                    continue
-                updated = True
-                if to_remove == deps:
-                    sorted_.append(item)
-                    del dependencies[item]
+        Determines the longest path through the graph using the *weights*
+        described in :meth:`remaining_path_lengths`. Returns a tuple
+        containing the length of the path and the list of its nodes in
+        dependency order.
+
+        If the weights are processing times, the length of this path is the
+        minimum time needed for processing all nodes, regardless of the number
+        of nodes processed concurrently.
+        """
+        lengths = self.remaining_path_lengths(weights)
+        if not lengths:
+            return 0, []
+        graph = self._get_graph()
+        node = max(self.solve(), key=lengths.get)
+        path = [node]
+        while True:
+            dependents = [graph.names[other]
+                          for other in graph.dependents(graph.position(node))]
+            if not dependents:
+                break
+            node = max(dependents, key=lengths.get)
+            path.append(node)
+        return lengths[path[0]], path
+
+    def schedule(self):
+        """
+        Creates a :class:`.DependencySchedule` for processing the nodes of
+        this solver in a streaming fashion: the caller receives nodes as soon
+        as all of their dependencies were marked as done. Will raise a
+        :class:`.DependencyLoop` if the graph contains a loop.
+
+        .. code-block:: python
+
+          schedule = solver.schedule()
+          pending = schedule.ready()
+          while pending:
+              node = pending.pop()
+              process(node)
+              pending += schedule.done(node)
+        """
+        nodes = self.solve()
+        graph = self._graph
+        counts = graph.dependency_counts()
+        return DependencySchedule(
+            nodes,
+            dict((graph.names[position], counts[position])
+                 for position in graph.nodes),
+            dict((graph.names[position],
+                  tuple(graph.names[other]
+                        for other in graph.dependents(position)))
+                 for position in graph.nodes))
+
+    def _find_loops(self, graph, remaining):
+        """
+        Returns all strongly connected components of given compact *graph*,
+        that contain at least one loop. The search is restricted to positions
+        with *remaining* dependencies, i.e. nodes that could not be sorted by
+        :meth:`solve`. Each component is a list of positions sorted by the
+        canonical order of the graph's *nodes*. The components are detected
+        using an iterative version of Tarjan's algorithm, which operates in
+        linear time.
+        """
+        canonical = dict((position, i)
+                         for i, position in enumerate(graph.nodes))
+        index = dict()
+        lowlink = dict()
+        stack = []
+        on_stack = set()
+        components = []
+        for root in graph.nodes:
+            if not remaining[root] or root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph.dependencies(root)))]
+            while work:
+                position, deps = work[-1]
+                for dep in deps:
+                    if not remaining[dep]:
+                        continue
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(graph.dependencies(dep))))
+                        break
+                    if dep in on_stack:
+                        lowlink[position] = min(lowlink[position], index[dep])
                 else:
-                    deps.difference_update(sorted_)
-        if dependencies:
-            item = next(iter(dependencies.keys()))
-            loop = [item, dependencies[item].pop()]
-            while loop[-1] not in loop[:-1]:
-                loop.append(dependencies[loop[-1]].pop())
-            raise DependencyLoop(loop)
-        return sorted_
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent],
+                                              lowlink[position])
+                    if lowlink[position] != index[position]:
+                        continue
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == position:
+                            break
+                    if len(component) > 1 or \
+                            position in graph.dependencies(position):
+                        components.append(
+                            sorted(component, key=canonical.get))
+        components.sort(key=lambda component: canonical[component[0]])
+        return components
+
+    def _find_loop(self, graph, component):
+        """
+        Returns a single circular dependency within given strongly connected
+        *component*, as returned by :meth:`_find_loops`. Every node in such a
+        component has at least one dependency within the component itself, so
+        walking these dependencies will eventually arrive at a node that was
+        already visited.
+        """
+        position = component[0]
+        component = set(component)
+        path = [position]
+        visited = {position: 0}
+        while True:
+            position = next(dep for dep in graph.dependencies(position)
+                            if dep in component)
+            if position in visited:
+                return path[visited[position]:] + [position]
+            visited[position] = len(path)
+            path.append(position)
+
+
+class _CompactGraph:
+    """
+    An immutable snapshot of the graph of a :class:`.DependencySolver` in
+    compressed sparse row format, indexed by the ids of the solver's nodes.
+    The snapshot is only created for solving the graph and is dropped once
+    the graph changes.
+
+    The member *nodes* contains the ids of all nodes, that are part of the
+    graph, in their canonical order: declared nodes come first, in the order
+    they were added, followed by nodes that were only ever registered as a
+    dependency.
+    """
+
+    def __init__(self, solver):
+        self.names = solver._names
+        self._ids = solver._ids
+        self.included = bytearray(solver._is_declared)
+        self.nodes = array('l', solver._declared)
+        for id_ in compress(range(len(self.names)), solver._dependents):
+            if not self.included[id_]:
+                self.included[id_] = 1
+                self.nodes.append(id_)
+        self._dependencies = self._build(solver._dependencies)
+        self._dependents = self._build(solver._dependents)
+
+    def _build(self, adjacency):
+        offsets = array('l', [0])
+        offsets.extend(accumulate(map(len, adjacency)))
+        return offsets, array('l', chain.from_iterable(adjacency))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def position(self, node):
+        id_ = self._ids.get(node)
+        if id_ is None or id_ >= len(self.included) or \
+                not self.included[id_]:
+            return None
+        return id_
+
+    def dependencies(self, position):
+        offsets, targets = self._dependencies
+        return targets[offsets[position]:offsets[position + 1]]
+
+    def dependents(self, position):
+        offsets, targets = self._dependents
+        return targets[offsets[position]:offsets[position + 1]]
+
+    def dependency_counts(self):
+        offsets = self._dependencies[0]
+        return array('l', map(sub, offsets[1:], offsets))
+
+
+class DependencySchedule:
+    """
+    A snapshot of a :class:`.DependencySolver`, that hands out nodes as soon as
+    their dependencies are done. Use :meth:`.DependencySolver.schedule` to
+    create an instance.
+
+    The schedule itself is not thread-safe: when processing nodes in multiple
+    threads, all calls to this object should happen in a single coordinating
+    thread.
+    """
+
+    def __init__(self, nodes, dependency_counts, dependents):
+        self._remaining = dependency_counts
+        self._dependents = dependents
+        self._ready = [node for node in nodes if not dependency_counts[node]]
+        self._handed_out = set()
+        self._done = set()
+        self._count = len(nodes)
+
+    def ready(self):
+        """
+        Returns all nodes, that are ready for processing, but were not handed
+        out by this schedule yet.
+        """
+        ready = [node for node in self._ready
+                 if node not in self._handed_out]
+        self._handed_out.update(ready)
+        self._ready = []
+        return ready
+
+    def done(self, node):
+        """
+        Marks given *node* as processed and returns the list of nodes, that
+        became ready due to this change. The returned nodes are considered
+        handed out, i.e. they will not be part of the next :meth:`ready` call.
+        """
+        if node not in self._handed_out:
+            raise ValueError('Node %s was not handed out yet' % (node,))
+        if node in self._done:
+            raise ValueError('Node %s was already marked as done' % (node,))
+        self._done.add(node)
+        unblocked = []
+        for other in self._dependents[node]:
+            self._remaining[other] -= 1
+            if not self._remaining[other]:
+                unblocked.append(other)
+        self._handed_out.update(unblocked)
+        return unblocked
+
+    @property
+    def finished(self):
+        """
+        Whether all nodes were marked as done.
+        """
+        return len(self._done) == self._count
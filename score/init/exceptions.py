@@ -44,13 +44,28 @@ class DependencyLoop(InitializationError):
     """
     Thrown if a dependency loop was detected during a call to :func:`.init` or
     :meth:`.ConfiguredModule._finalize`.
+
+    The member *loop* contains a single circular dependency as a list of
+    module names, starting and ending with the same module. The member *loops*
+    contains every group of modules involved in a circular dependency, i.e.
+    each strongly connected component of the dependency graph, that contains a
+    loop.
     """
 
-    def __init__(self, loop, *, module='score.init'):
+    def __init__(self, loop, *, module='score.init', loops=None):
         self.loop = loop
-        message = (
-            'Circular dependency between the following modules:\n - ' +
-            '\n - '.join(loop))
+        if loops is None:
+            loops = [loop]
+        self.loops = loops
+        if len(loops) > 1:
+            message = (
+                'Circular dependencies between the following groups of '
+                'modules:\n - ' +
+                '\n - '.join(', '.join(group) for group in loops))
+        else:
+            message = (
+                'Circular dependency between the following modules:\n - ' +
+                '\n - '.join(loop))
         super().__init__(module, message)
 
 
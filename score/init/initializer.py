@@ -27,21 +27,36 @@
 import abc
 import configparser
 import importlib
-from inspect import signature, Parameter
+import inspect
 import logging
+import os
 import pkgutil
 import sys
-from .config import parse_list, parse_config_file
-from .exceptions import InitializationError, ConfigurationError
+import threading
+import weakref
+from .config import (
+    parse_bool, parse_list, parse_config_file, init_cache_folder)
+from .cache import DependencyCache, TimingCache
+from .config.view import ConfigView, SectionView
+from .manifest import read_manifest
+from .exceptions import (
+    InitializationError, ConfigurationError, DependencyLoop)
 from .dependency import DependencySolver
+from .report import InitReport
 from collections import OrderedDict
 from types import ModuleType
 
 
 log = logging.getLogger(__name__)
 
+# weak reference to the score of the latest init_prefork() call, whose
+# modules are notified in forked processes by _after_fork()
+_prefork_score = None
+_prefork_lock = threading.Lock()
 
-def init(confdict, *, overrides={}, init_logging=True, finalize=True):
+
+def init(confdict, *, overrides={}, init_logging=True, finalize=True,
+         workers=None, lazy=None, only=None):
     """
     This function automates the process of initializing all other modules. It
     will operate on given *confdict*, which is expected to be a
@@ -58,16 +73,151 @@ def init(confdict, *, overrides={}, init_logging=True, finalize=True):
         A list of module names that shall be initialized. If this value is
         missing, you will end up with an empty :class:`.ConfiguredScore` object.
 
+        Modules with a slow ``init`` function can be marked to be initialized
+        in the background, like ``score.es:es(background)``. Such modules, as
+        well as all modules depending on them, are initialized (and finalized)
+        in separate threads and the :class:`.ConfiguredScore` is returned
+        without waiting for them. Accessing one of these modules as a member
+        of the :class:`.ConfiguredScore` blocks until that module and its
+        finalize dependencies are ready, or raises the exception of its
+        failed initialization (or that of a failed dependency). The
+        ``_finalize`` functions of the other modules may not require any of
+        them. This marker is ignored by :func:`.init_async` and if the
+        modules are initialized ``lazy``.
+
+    :confkey:`workers` :faint:`[default=0]`
+        The number of threads to use for initializing modules. Modules are
+        initialized one after the other by default. If this value is greater
+        than 1, independent modules are initialized concurrently in a thread
+        pool of the given size as soon as all their dependencies are
+        initialized.
+
+    :confkey:`report` :faint:`[default=false]`
+        Whether a table containing the time spent importing, initializing and
+        finalizing each module should be logged once the initialization is
+        complete. The same information is always available as the
+        :class:`.InitReport` in the member ``_init_report`` of the resulting
+        :class:`.ConfiguredScore`.
+
+    :confkey:`profile_imports` :faint:`[default=false]`
+        Whether the time spent importing each python module should be
+        measured while importing the configured modules and the ``autoimport``
+        paths. Each imported python module is attributed to the alias of the
+        module, that triggered its import. The results are available in the
+        member ``imports`` of the :class:`.InitReport` and are logged along
+        with the ``report``, if that is enabled.
+
+    :confkey:`profile_memory` :faint:`[default=false]`
+        Whether the memory, that each module's import, init and finalize
+        leave allocated, should be measured using :mod:`tracemalloc`. The
+        results are available as the *memory* values of each
+        :class:`.ModuleReport` and are logged along with the ``report``, if
+        that is enabled. This considerably slows down the initialization and
+        the measurements are only accurate without ``workers``.
+
+    :confkey:`trace` :faint:`[default=None]`
+        Path to a file, that will receive a timeline of all imports, init and
+        finalize calls once the initialization is complete. The file is in the
+        trace event format, which can be inspected with ``chrome://tracing`` or
+        Perfetto. The path can also be provided via the environment variable
+        ``SCORE_INIT_TRACE``.
+
+    :confkey:`cachedir` :faint:`[default=None]`
+        A folder for storing the dependencies declared by the signatures of
+        each module's ``init`` and ``_finalize`` functions. Later
+        initializations will re-use these values as long as the files defining
+        these functions remain unchanged.
+
+        The folder also receives the duration of each module's ``init``
+        function. If ``workers`` are used, later initializations start the
+        modules with the longest remaining chain of dependent modules first.
+        These durations also provide the prediction of
+        :func:`.critical_path`.
+
+    :confkey:`lazy` :faint:`[default=false]`
+        Whether modules should be initialized on demand: the returned
+        :class:`.ConfiguredScore` will initialize (and finalize) each module
+        and its dependencies the first time the module is accessed as a member.
+        This is useful for short-lived processes, that only need a few of the
+        configured modules. The ``report`` and the ``trace`` are published
+        (and the durations stored in the ``cachedir``) after each of these
+        initializations. The ``profile_memory`` measurements continue until
+        all configured modules were initialized.
+
+    :confkey:`only` :faint:`[default=None]`
+        A list of aliases of the modules, that shall be initialized. Only
+        these modules and their transitive dependencies are imported and
+        initialized, all other configured modules are skipped entirely. This
+        is useful for tools, that only need a small part of an application.
+        The ``_finalize`` functions of these modules may not require any of
+        the skipped modules.
+
     The provided *overrides* will be integrated into the actual *confdict*
     prior to initialization. While the confdict is assumed to be retrieved from
     external resources (like a configuration file), this parameter aims to make
     programmatic adjustment of the configuration a bit easier.
 
+    Neither the *confdict* nor the *overrides* are modified: the configuration
+    is accessed through a read-only :class:`.ConfigView`, which layers the
+    overrides on top of the confdict. The same applies to the confdict each
+    module receives, which is a :class:`.SectionView`.
+
+    The dependencies of each module are usually determined by importing it and
+    inspecting the signature of its ``init`` function. Packages may declare
+    their dependencies statically in a :class:`.Manifest` file instead, in
+    which case they are only imported right before they are initialized.
+
     The final parameter *init_logging* makes sure python's own logging
     facility is initialized with the provided configuration, too.
 
+    The values of *workers*, *lazy* and *only* may also be passed as keyword
+    arguments, which take precedence over the configuration values of the
+    same name.
+
     This function returns a :class:`.ConfiguredScore` object.
     """
+    report = InitReport()
+    _confdict = _prepare_confdict(confdict, overrides, init_logging, report)
+    if workers is None:
+        workers = _get_option(_confdict, 'workers', int, 0)
+    if lazy is None:
+        lazy = _get_option(_confdict, 'lazy', parse_bool, False)
+    if only is None:
+        only = _get_option(_confdict, 'only', parse_list, None)
+    elif isinstance(only, str):
+        only = parse_list(only)
+    return _init(_confdict, finalize, workers, lazy, report, only)
+
+
+async def init_async(confdict, *, overrides={}, init_logging=True,
+                     finalize=True, only=None):
+    """
+    Coroutine variant of :func:`.init`, that must be awaited in a running
+    :mod:`asyncio` event loop. Accepts the same arguments as :func:`.init`,
+    except for *workers* and *lazy*.
+
+    Modules may provide a coroutine function as their ``init`` and their
+    :meth:`ConfiguredModule._finalize` may be a coroutine function, too. All
+    modules, whose dependencies are ready, are initialized (and finalized)
+    concurrently. Synchronous ``init`` and ``_finalize`` functions are still
+    supported, but will block the event loop while they run.
+    """
+    report = InitReport()
+    _confdict = _prepare_confdict(confdict, overrides, init_logging, report)
+    if only is None:
+        only = _get_option(_confdict, 'only', parse_list, None)
+    elif isinstance(only, str):
+        only = parse_list(only)
+    return await _init_async(_confdict, finalize, report, only)
+
+
+def _prepare_confdict(confdict, overrides, init_logging, report):
+    """
+    Performs the steps of :func:`.init`, that precede the actual
+    initialization: initializes logging, creates a :class:`.ConfigView` of
+    the *confdict* including the *overrides* and performs the
+    ``autoimport``. Also configures the given :class:`.InitReport`.
+    """
     if init_logging and 'formatters' in confdict:
         import logging.config
         # the fileConfig() function below expects a RawConfigParser instance;
@@ -79,26 +229,60 @@ def init(confdict, *, overrides={}, init_logging=True, finalize=True):
             parser = configparser.RawConfigParser()
             parser.read_dict(confdict)
         logging.config.fileConfig(parser, disable_existing_loggers=False)
-    if isinstance(confdict, configparser.RawConfigParser):
-        _confdict = OrderedDict()
-        for section in confdict:
-            _confdict[section] = OrderedDict()
-            for k, v in confdict[section].items():
-                _confdict[section][k] = v
-    else:
-        _confdict = confdict
-    for section in overrides:
-        if section not in _confdict:
-            _confdict[section] = OrderedDict()
-        for key, value in overrides[section].items():
-            _confdict[section][key] = value
+    _confdict = _apply_overrides(confdict, overrides)
+    report.profile_imports = _get_option(
+        _confdict, 'profile_imports', parse_bool, False)
+    if _get_option(_confdict, 'profile_memory', parse_bool, False):
+        report.start_memory_profiling()
     try:
         paths = _confdict['score.init']['autoimport']
     except KeyError:
         pass
     else:
-        _perform_autoimport(parse_list(paths))
-    return _init(_confdict, finalize)
+        with report.profiling_imports('autoimport'):
+            _perform_autoimport(parse_list(paths))
+    return _confdict
+
+
+def _apply_overrides(confdict, overrides):
+    """
+    Returns a :class:`.ConfigView` of given *confdict*, which may also be a
+    :class:`configparser.RawConfigParser`, with the *overrides* layered on
+    top. Neither of the arguments is modified. Plain mappings are copied
+    once, since the caller might still modify them, while a
+    :class:`.ConfigView` or a :class:`configparser.RawConfigParser` is used
+    as-is.
+    """
+    if isinstance(confdict, configparser.RawConfigParser):
+        confdict = ConfigView(confdict)
+    elif not isinstance(confdict, ConfigView):
+        confdict = ConfigView(_copy_confdict(confdict))
+    if overrides:
+        confdict = confdict.layer(_copy_confdict(overrides))
+    return confdict
+
+
+def _copy_confdict(confdict):
+    return dict((section, dict(values))
+                for section, values in confdict.items())
+
+
+def _get_option(confdict, key, converter, default):
+    """
+    Returns the value of given *key* in the ``score.init`` section of the
+    *confdict*, converted using given *converter* function. Returns the
+    *default* value, if the key is missing.
+    """
+    try:
+        value = confdict['score.init'][key]
+    except KeyError:
+        return default
+    try:
+        return converter(value)
+    except ValueError as e:
+        raise ConfigurationError(
+            __package__,
+            'Invalid value for score.init/%s: %s' % (key, value)) from e
 
 
 def _perform_autoimport(paths):
@@ -121,60 +305,622 @@ def _perform_autoimport(paths):
                 __import__('%s.%s' % (path, modname))
 
 
-def _init(confdict, finalize=True):
-    try:
-        modconf = parse_list(confdict['score.init']['modules'])
-    except KeyError:
+def _init(confdict, finalize=True, workers=0, lazy=False, report=None,
+          only=None):
+    plan = _create_plan(confdict, report, only)
+    if plan is None:
         # TODO: issue a warning through the warnings module
-        return ConfiguredScore(confdict, dict(), dict())
-    modules, dependency_aliases = _collect_modules(modconf)
-    dependency_map = _collect_dependencies(modules, dependency_aliases)
-    initialized = dict()
-    sorted_aliases = _sort_modules(
-        dependency_map, dependency_aliases, 'initialization')
-    for alias in sorted_aliases:
-        modname = modules[alias]
-        module_dependencies = dependency_map[alias]
-        modconf = OrderedDict()
-        if alias in confdict:
-            modconf = confdict[alias]
-        for key in confdict:
-            if key.startswith('%s:' % alias):
-                key_prefix = key[len(alias)+1:] + '.'
-                modconf.update((key_prefix + k, v)
-                               for k, v in confdict[key].items())
-        kwargs = {}
-        for dep in module_dependencies:
-            try:
-                dependency_alias = dependency_aliases[alias][dep]
-            except KeyError:
-                kwargs[dep] = initialized[dep]
-            else:
-                kwargs[dep] = initialized[dependency_alias]
-        log.debug('Initializing %s as %s' % (modname, alias))
-        conf = importlib.import_module(modname).init(modconf, **kwargs)
-        if not isinstance(conf, ConfiguredModule):
-            raise InitializationError(
-                __package__,
-                '%s initializer did not return ConfiguredModule but %s' %
-                (alias, repr(conf)))
-        initialized[alias] = conf
-    score = ConfiguredScore(confdict, initialized, dependency_aliases)
+        score = ConfiguredScore(confdict, dict(), dict(), report=report)
+        _publish_report(score)
+        return score
+    return _run_plan(plan, finalize, workers, lazy)
+
+
+def _run_plan(plan, finalize=True, workers=0, lazy=False):
+    """
+    Initializes all modules of given :class:`_InitPlan` and returns the
+    resulting :class:`.ConfiguredScore`.
+    """
+    confdict = plan.confdict
+    if lazy:
+        # reports dependency loops right away instead of on first access
+        plan.depsolv.solve()
+        return ConfiguredScore(
+            confdict, OrderedDict(), plan.dependency_aliases,
+            workers=workers, plan=plan, lazy=True, finalize=finalize,
+            report=plan.report, cache=plan.cache)
+    deferred = plan.deferred_modules()
+    if deferred:
+        depsolv = _create_solver(
+            dict((alias, dependencies)
+                 for alias, dependencies in plan.dependency_map.items()
+                 if alias not in deferred),
+            plan.dependency_aliases)
+        order = None
+        if plan.init_order is not None:
+            order = [alias for alias in plan.init_order
+                     if alias not in deferred]
+    else:
+        depsolv, order = plan.depsolv, plan.init_order
+    priorities = None
+    if workers > 1 and plan.timings.durations:
+        priorities = plan.depsolv.remaining_path_lengths(
+            plan.timings.durations)
+    plan.report.begin('init')
+    initialized = _process(depsolv, plan.init_module, workers, order,
+                           priorities)
+    score = ConfiguredScore(confdict, initialized, plan.dependency_aliases,
+                            workers=workers, plan=plan, report=plan.report,
+                            cache=plan.cache)
     if finalize:
         score._finalize()
+    if deferred:
+        score._start_background(deferred, finalize)
+        return score
+    plan.cache.save()
+    _publish_report(score)
+    return score
+
+
+async def _init_async(confdict, finalize=True, report=None, only=None):
+    plan = _create_plan(confdict, report, only)
+    if plan is None:
+        score = ConfiguredScore(confdict, dict(), dict(), report=report)
+        _publish_report(score)
+        return score
+    plan.report.begin('init')
+    initialized = await _process_async(plan.depsolv, plan.init_module_async)
+    score = ConfiguredScore(confdict, initialized, plan.dependency_aliases,
+                            plan=plan, report=plan.report, cache=plan.cache)
+    if finalize:
+        await score._finalize_async()
+    plan.cache.save()
+    _publish_report(score)
     return score
 
 
-def init_from_file(file, *, overrides={}, init_logging=True):
+def _publish_report(score, final=True):
+    """
+    Logs the summary of the :class:`.InitReport` of given *score*, if the
+    configuration value ``report`` is set, and writes its trace file, if
+    the configuration value ``trace`` is set. Also stores the init durations
+    of all modules and stops the memory profiling of the report, unless this
+    is not the *final* publication of the report.
+    """
+    profiled_memory = score._init_report.profile_memory
+    if final:
+        score._init_report.stop_memory_profiling()
+    if score._plan is not None:
+        score._plan.timings.update(score._init_report)
+        score._plan.timings.save()
+    if _get_option(score.conf, 'report', parse_bool, False):
+        log.info('Initialization report (in milliseconds):\n%s' %
+                 score._init_report.summary())
+        if score._init_report.profile_imports:
+            log.info('Slowest imports (in milliseconds):\n%s' %
+                     score._init_report.import_summary())
+        if profiled_memory:
+            log.info('Memory report:\n%s' %
+                     score._init_report.memory_summary())
+    trace = _get_option(score.conf, 'trace', str,
+                        os.environ.get('SCORE_INIT_TRACE'))
+    if trace:
+        score._init_report.write_trace(trace)
+
+
+def _create_plan(confdict, report=None, only=None):
+    """
+    Creates the :class:`_InitPlan` for given *confdict*, or returns `None`, if
+    the confdict does not configure any modules. The timings of the imports
+    are recorded in the given :class:`.InitReport`. The plan can be
+    restricted to the aliases in *only* and their transitive dependencies.
+    """
+    try:
+        modconf = parse_list(confdict['score.init']['modules'])
+    except KeyError:
+        return None
+    if report is None:
+        report = InitReport()
+    cache = _create_dependency_cache(confdict)
+    timings = _create_timing_cache(confdict)
+    report.begin('import')
+    modules, dependency_aliases, background = _collect_modules(modconf)
+    manifests = dict()
+    dependency_map = _collect_dependencies(
+        modules, dependency_aliases, report, cache, manifests, only)
+    finalize_map = dict(
+        (alias, manifest.finalize_dependencies)
+        for alias, manifest in manifests.items()
+        if manifest.finalize_dependencies is not None)
+    return _InitPlan(confdict, modules, dependency_aliases, dependency_map,
+                     report, cache, finalize_map, background=background,
+                     timings=timings, manifests=manifests)
+
+
+def _create_dependency_cache(confdict):
+    """
+    Creates the :class:`.DependencyCache` for given *confdict*, which is only
+    persisted if the configuration value ``cachedir`` is present.
+    """
+    return DependencyCache(_cache_file(confdict, 'dependencies.json'))
+
+
+def _create_timing_cache(confdict):
+    """
+    Creates the :class:`.TimingCache` for given *confdict*, which is only
+    persisted if the configuration value ``cachedir`` is present.
+    """
+    return TimingCache(_cache_file(confdict, 'timings.json'))
+
+
+def _cache_file(confdict, name):
+    """
+    Returns the path of the file with given *name* in the folder configured
+    as ``cachedir``, or `None` if the configuration value is missing.
+    """
+    if 'cachedir' not in confdict.get('score.init', {}):
+        return None
+    folder = init_cache_folder(confdict['score.init'], 'cachedir')
+    return os.path.join(folder, name)
+
+
+class _InitPlan:
+    """
+    Everything needed for initializing the modules configured in a
+    *confdict*: the *modules* `dict` maps aliases to module names, the
+    *dependency_map* contains the dependencies of each alias and
+    *dependency_aliases* the explicit assignments of dependencies to other
+    aliases. The member *depsolv* is a :class:`.DependencySolver` for the
+    initialization order, *report* the :class:`.InitReport` recording the
+    timings of each module and *cache* the :class:`.DependencyCache` used
+    for inspecting signatures.
+
+    The *finalize_map* contains the finalize dependencies of all modules,
+    that declared them in their :class:`.Manifest`. Such modules are only
+    imported right before they are initialized. The `dict` of *manifests*
+    maps the aliases of these modules to their :class:`.Manifest`, which is
+    validated against the signature of the ``init`` function once the module
+    was imported.
+
+    Plans loaded via :func:`.init_from_plan` also provide the *init_order*
+    and the *finalize_order* of the modules, which are otherwise `None`.
+
+    The *background* aliases are those marked to be initialized in the
+    background (see the configuration value ``modules`` of :func:`.init`).
+    The :class:`.TimingCache` *timings* contains the init durations of the
+    previous initialization.
+    """
+
+    def __init__(self, confdict, modules, dependency_aliases, dependency_map,
+                 report, cache, finalize_map, *, init_order=None,
+                 finalize_order=None, background=(), timings=None,
+                 manifests=None):
+        self.confdict = confdict
+        if manifests is None:
+            manifests = {}
+        self.manifests = manifests
+        self.background = set(background)
+        if timings is None:
+            timings = TimingCache()
+        self.timings = timings
+        self.report = report
+        self.cache = cache
+        self.finalize_map = finalize_map
+        self.init_order = init_order
+        self.finalize_order = finalize_order
+        self.modules = modules
+        self.dependency_aliases = dependency_aliases
+        self.dependency_map = dependency_map
+        self.depsolv = _create_solver(dependency_map, dependency_aliases)
+
+    def critical_path(self):
+        """
+        Returns the predicted duration of the init phase in seconds, based on
+        the durations of the previous initialization, and the list of aliases
+        forming the longest chain of dependencies. See
+        :func:`.critical_path`.
+        """
+        return self.depsolv.critical_path(self.timings.durations)
+
+    def deferred_modules(self):
+        """
+        Returns the `set` of all modules, that are initialized in the
+        background: the *background* modules and their transitive dependents.
+        """
+        deferred = set()
+        for alias in self.background:
+            if alias not in self.modules or alias not in self.dependency_map:
+                continue
+            deferred.add(alias)
+            deferred.update(self.depsolv.transitive_dependents(alias))
+        return deferred
+
+    def prepare(self, alias, initialized):
+        """
+        Collects everything needed for initializing the module with given
+        *alias*: returns its ``init`` function, its confdict and the keyword
+        arguments containing its dependencies, which are taken from the `dict`
+        of *initialized* modules.
+        """
+        modname = self.modules[alias]
+        modconf = _module_conf(self.confdict, alias)
+        kwargs = _dependency_kwargs(
+            alias, self.dependency_map[alias], self.dependency_aliases,
+            initialized)
+        module = sys.modules.get(modname)
+        if module is None:
+            with self.report.measure('import', alias):
+                module = importlib.import_module(modname)
+            _check_init_function(modname, module)
+        if alias in self.manifests:
+            self._check_manifest(alias, module)
+        log.debug('Initializing %s as %s' % (modname, alias))
+        return module.init, modconf, kwargs
+
+    def _check_manifest(self, alias, module):
+        """
+        Raises a :class:`.ConfigurationError`, if the init dependencies
+        declared in the :class:`.Manifest` of the module with given *alias*
+        differ from the parameters of its ``init`` function.
+        """
+        manifest = self.manifests[alias]
+        declared = set(manifest.init_dependencies)
+        actual = set(self.cache.dependencies(module.init, skip=1))
+        if declared == actual:
+            return
+        raise ConfigurationError(
+            __package__,
+            'Manifest %s does not match the init() function of %s:\n'
+            ' - declared: %s\n - actual: %s' % (
+                manifest.file, module.__name__,
+                _format_dependencies(declared),
+                _format_dependencies(actual)))
+
+    def init_module(self, alias, initialized):
+        """
+        Initializes the module with given *alias* and returns its
+        :class:`.ConfiguredModule`.
+        """
+        init, modconf, kwargs = self.prepare(alias, initialized)
+        with self.report.measure(
+                'init', alias, self.depsolv.direct_dependencies(alias)):
+            conf = init(modconf, **kwargs)
+        return _check_init_result(alias, conf)
+
+    async def init_module_async(self, alias, initialized):
+        """
+        Coroutine variant of :meth:`init_module`, which also accepts coroutine
+        ``init`` functions.
+        """
+        init, modconf, kwargs = self.prepare(alias, initialized)
+        with self.report.measure(
+                'init', alias, self.depsolv.direct_dependencies(alias)):
+            conf = init(modconf, **kwargs)
+            if inspect.isawaitable(conf):
+                conf = await conf
+        return _check_init_result(alias, conf)
+
+
+def _format_dependencies(dependencies):
+    return ', '.join(
+        '%s (optional)' % dep if optional else dep
+        for dep, optional in sorted(dependencies)) or '-'
+
+
+def _dependency_kwargs(alias, dependencies, dependency_aliases, available):
+    """
+    Creates the keyword arguments for the ``init`` or ``_finalize`` function
+    of the module with given *alias*, taking the values of the given
+    *dependencies* from the `dict` of *available* modules.
+    """
+    kwargs = {}
+    for dep in dependencies:
+        try:
+            dependency_alias = dependency_aliases[alias][dep]
+        except KeyError:
+            kwargs[dep] = available[dep]
+        else:
+            kwargs[dep] = available[dependency_alias]
+    return kwargs
+
+
+def _module_conf(confdict, alias):
+    """
+    Returns the configuration of the module with given *alias* as it is passed
+    to its ``init`` function: a :class:`.SectionView` of its own section with
+    the values of all its ``alias:`` sub-sections layered on top. The
+    *confdict* itself remains unmodified.
+    """
+    if not isinstance(confdict, ConfigView):
+        confdict = ConfigView(confdict)
+    layers = []
+    if alias in confdict:
+        layers.append(confdict[alias])
+    for key in confdict.subsections(alias):
+        key_prefix = key[len(alias)+1:] + '.'
+        layers.append(confdict[key].prefixed(key_prefix))
+    return SectionView(*layers)
+
+
+def _check_init_result(alias, conf):
+    if inspect.isawaitable(conf):
+        if inspect.iscoroutine(conf):
+            conf.close()
+        raise InitializationError(
+            __package__,
+            '%s initializer is a coroutine function, '
+            'use init_async() to initialize it' % (alias,))
+    if not isinstance(conf, ConfiguredModule):
+        raise InitializationError(
+            __package__,
+            '%s initializer did not return ConfiguredModule but %s' %
+            (alias, repr(conf)))
+    return conf
+
+
+def _process(depsolv, callback, workers=0, order=None, priorities=None):
+    """
+    Invokes *callback* for every node of given :class:`.DependencySolver` in
+    dependency order. The callback receives the node and a `dict` containing
+    the results of all previous invocations and its own return value is added
+    to that `dict`, once it completes.
+
+    If the number of *workers* is greater than 1, the callbacks are invoked in
+    a thread pool of that size, as soon as the callbacks of all dependencies
+    of a node have completed. Whenever more nodes are ready than workers are
+    available, the nodes with the highest value in the `dict` of
+    *priorities* are processed first. The first exception raised by a
+    callback prevents further invocations and is re-raised once all running
+    callbacks are finished.
+
+    Returns the `dict` of results, ordered like the result of
+    :meth:`.DependencySolver.solve`. A previously computed *order* of the
+    nodes may be passed to avoid solving the dependencies once more.
+    """
+    sorted_ = order if order is not None else depsolv.solve()
+    results = dict()
+    if workers <= 1:
+        for node in sorted_:
+            results[node] = callback(node, results)
+    else:
+        from concurrent.futures import ThreadPoolExecutor, wait, \
+            FIRST_COMPLETED
+        schedule = depsolv.schedule()
+        with ThreadPoolExecutor(workers) as executor:
+            futures = dict()
+            ready = []
+
+            def submit(nodes):
+                ready.extend(nodes)
+                if priorities:
+                    ready.sort(key=lambda node: -priorities.get(node, 0))
+                while ready and len(futures) < workers:
+                    node = ready.pop(0)
+                    future = executor.submit(callback, node, results)
+                    futures[future] = node
+
+            submit(schedule.ready())
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = futures.pop(future)
+                    if future.exception() is not None:
+                        for pending in futures:
+                            pending.cancel()
+                        wait(futures)
+                        raise future.exception()
+                    results[node] = future.result()
+                    submit(schedule.done(node))
+    return OrderedDict((node, results[node]) for node in sorted_)
+
+
+async def _process_async(depsolv, callback):
+    """
+    Coroutine variant of :func:`_process`, that expects a coroutine function
+    as *callback*. All callbacks, whose dependencies have completed, are
+    awaited concurrently.
+    """
+    import asyncio
+    sorted_ = depsolv.solve()
+    results = dict()
+    schedule = depsolv.schedule()
+    tasks = dict()
+
+    def submit(nodes):
+        for node in nodes:
+            tasks[asyncio.ensure_future(callback(node, results))] = node
+
+    submit(schedule.ready())
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node = tasks.pop(task)
+                results[node] = task.result()
+                submit(schedule.done(node))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+        raise
+    return OrderedDict((node, results[node]) for node in sorted_)
+
+
+def init_from_file(file, *, overrides={}, init_logging=True,
+                   preimport=False):
     """
     Reads configuration from given *file* using
     :func:`.config.parse_config_file` and initializes score using :func:`.init`.
     See the documentation of :func:`.init` for a description of all keyword
     arguments.
+
+    If *preimport* is `True`, the configured ``modules`` and ``autoimport``
+    paths are imported in a background thread as soon as a configuration
+    file mentioning them was read, while the remaining files are still being
+    parsed. This shortens the startup of applications with many or slow
+    imports. Note that modules removed by an adjustment file may still get
+    imported this way, and that these imports are not part of the
+    ``profile_imports`` report.
     """
-    return init(parse_config_file(file, return_configparser=init_logging),
-                overrides=overrides,
-                init_logging=init_logging)
+    listener = None
+    if preimport:
+        listener = _Preimporter()
+    try:
+        confdict = parse_config_file(
+            file, return_configparser=init_logging, listener=listener)
+    finally:
+        if listener is not None:
+            listener.close()
+    return init(confdict, overrides=overrides, init_logging=init_logging)
+
+
+class _Preimporter:
+    """
+    A listener for :func:`.config.parse_config_file`, that imports the
+    ``modules`` and ``autoimport`` paths found in each parsed file in a
+    background thread. Failing imports are ignored, since the configuration
+    might still change; the actual import during the initialization will
+    raise the error again.
+    """
+
+    def __init__(self):
+        import queue
+        self._queue = queue.Queue()
+        self._queued = set()
+        self._thread = None
+
+    def __call__(self, settings):
+        if 'score.init' not in settings:
+            return
+        section = settings['score.init']
+        if 'modules' in section:
+            for line in _preimport_candidates(
+                    section.get('modules', raw=True)):
+                modules, _, _ = _collect_modules([line])
+                for modname in modules.values():
+                    self._put(importlib.import_module, modname)
+        if 'autoimport' in section:
+            for path in _preimport_candidates(
+                    section.get('autoimport', raw=True)):
+                self._put(_perform_autoimport, path)
+
+    def _put(self, func, name):
+        if name in self._queued:
+            return
+        self._queued.add(name)
+        self._queue.put((func, name))
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name='score.init-preimport', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            func, name = item
+            try:
+                func(name)
+            except Exception:
+                log.debug('Could not pre-import %s' % name, exc_info=True)
+
+    def close(self):
+        """
+        Stops the background thread once all queued imports are done.
+        """
+        self._queue.put(None)
+
+
+def _preimport_candidates(value):
+    """
+    Extracts the lines of a raw configuration *value*, that might end up in
+    the final configuration: adjustments in diff format contribute their
+    added and anchor lines, values to be deleted or replaced none at all.
+    """
+    value = value.strip()
+    if value.startswith('<diff>'):
+        value = value[len('<diff>'):]
+    elif value.startswith('<'):
+        return []
+    candidates = []
+    for line in parse_list(value):
+        if line.startswith('-') or '${' in line:
+            continue
+        candidates.append(line.lstrip('+').strip())
+    return candidates
+
+
+def init_prefork(confdict, **kwargs):
+    """
+    Initializes score using :func:`.init` in a process, that is going to fork
+    worker processes afterwards. Accepts the same arguments as :func:`.init`.
+
+    Once all modules are initialized and finalized, this function performs a
+    garbage collection and moves all remaining objects into the permanent
+    generation of the garbage collector using :func:`gc.freeze`. The garbage
+    collector thus no longer touches these objects, which allows forked
+    processes to share the memory pages containing the initialized state,
+    instead of gradually copying them.
+
+    It also registers the :meth:`ConfiguredModule._after_fork` functions of
+    all modules to be called in each forked child process. Only the score of
+    the latest call is notified and it is not kept alive for this purpose.
+
+    Modules marked to be initialized in the background are waited for, since
+    the thread initializing them would not exist in the forked processes.
+    Lazy initialization is not supported, as the modules would only be
+    initialized in each forked process separately.
+
+    This function requires Python 3.7 or later.
+    """
+    import gc
+    if not hasattr(gc, 'freeze') or not hasattr(os, 'register_at_fork'):
+        raise InitializationError(
+            __package__, 'init_prefork() requires Python 3.7 or later')
+    score = init(confdict, **kwargs)
+    if score._lazy:
+        raise ConfigurationError(
+            __package__, 'init_prefork() does not support lazy initialization')
+    score._join_background()
+    gc.collect()
+    gc.freeze()
+    global _prefork_score
+    with _prefork_lock:
+        if _prefork_score is None:
+            os.register_at_fork(after_in_child=_after_fork)
+        _prefork_score = weakref.ref(score)
+    return score
+
+
+def _after_fork():
+    score = _prefork_score()
+    if score is not None:
+        score._after_fork()
+
+
+def critical_path(confdict, *, overrides={}):
+    """
+    Predicts the duration of the init phase of given *confdict* (see
+    :func:`.init` for a description of the arguments) without initializing
+    any modules. The prediction is based on the durations of the ``init``
+    functions during the previous initialization, which are only available
+    if the configuration value ``cachedir`` is present.
+
+    Returns a tuple containing the predicted duration in seconds and the list
+    of aliases forming the longest chain of dependent modules, i.e. the
+    modules determining the duration even with an unlimited number of
+    ``workers``.
+    """
+    report = InitReport()
+    _confdict = _prepare_confdict(confdict, overrides, False, report)
+    report.stop_memory_profiling()
+    plan = _create_plan(_confdict, report)
+    if plan is None:
+        return 0, []
+    return plan.critical_path()
 
 
 def init_logging_from_file(file):
@@ -208,6 +954,16 @@ class ConfiguredModule(metaclass=abc.ABCMeta):
         """
         pass
 
+    def _after_fork(self):
+        """
+        Called in the child process, whenever a process with an initialized
+        :class:`.ConfiguredScore` forks, if the score was initialized using
+        :func:`.init_prefork`. Modules can use this hook to re-create
+        resources, that must not be shared between processes, like sockets or
+        database connections.
+        """
+        pass
+
     @property
     def _module(self):
         return _import(self._module_name)
@@ -225,59 +981,568 @@ class ConfiguredScore(ConfiguredModule):
     """
     The return value of :func:`.init`. Contains the resulting
     :class:`.ConfiguredModule` of every initialized module as a member.
+
+    The given number of *workers* is used during finalization: if it is
+    greater than 1, independent modules are finalized concurrently. See the
+    configuration value ``workers`` of :func:`.init` for details.
+
+    The initialization *plan* provides the statically declared finalize
+    dependencies of modules. If *lazy* is `True`, the object initializes the
+    missing modules of that plan on first access (see the configuration value
+    ``lazy`` of :func:`.init`). Such modules are also finalized right away,
+    unless *finalize* is `False`.
+
+    The timings of all modules are recorded in the given :class:`.InitReport`,
+    which is available as *_init_report*. The signatures of the finalizers are
+    inspected through the given :class:`.DependencyCache`.
+
+    Modules marked to be initialized in the background are only available as
+    members once they and their finalize dependencies are ready (see the
+    configuration value ``modules`` of :func:`.init`).
     """
 
-    def __init__(self, confdict, modules, dependency_aliases):
+    def __init__(self, confdict, modules, dependency_aliases, *, workers=0,
+                 plan=None, lazy=False, finalize=True, report=None,
+                 cache=None):
         import score.init
         ConfiguredModule.__init__(self, score.init)
         self.conf = confdict
         self._modules = modules
         self._module_dependency_aliases = dependency_aliases
+        self._workers = workers
+        # ids of the modules, whose _finalize is currently running in some
+        # thread. Other threads wait for these modules instead of finalizing
+        # them once more.
+        self._finalizing = set()
+        self._finalize_condition = threading.Condition()
+        self._plan = plan
+        self._lazy = lazy
+        self._lazy_finalize = finalize
+        self._load_lock = threading.RLock()
+        if report is None:
+            report = InitReport()
+        self._init_report = report
+        if cache is None:
+            cache = DependencyCache()
+        self._dependency_cache = cache
+        # aliases of the modules, that are still being initialized in the
+        # background, and the exceptions of those, that failed
+        self._background = set()
+        self._background_errors = dict()
+        self._background_condition = threading.Condition()
         for alias, conf in modules.items():
             setattr(self, alias, conf)
 
+    def _after_fork(self):
+        for alias, conf in list(self._modules.items()):
+            log.debug('Calling fork handler of %s' % (alias))
+            conf._after_fork()
+
+    def __getattr__(self, name):
+        if name in self.__dict__.get('_background', ()) or \
+                name in self.__dict__.get('_background_errors', ()):
+            self._join_background(name)
+            return self.__dict__[name]
+        if not self.__dict__.get('_lazy') or name not in self._plan.modules:
+            raise AttributeError(name)
+        return self._load(name)
+
+    def _start_background(self, aliases, finalize=True):
+        """
+        Starts initializing the modules with given *aliases* of the
+        initialization plan in a separate thread. Their dependencies must
+        already be initialized.
+        """
+        self._background = set(aliases)
+        thread = threading.Thread(
+            target=self._init_background, args=(finalize,),
+            name='score.init-background', daemon=True)
+        thread.start()
+
+    def _init_background(self, finalize):
+        plan = self._plan
+        aliases = set(self._background)
+        # the background modules, that were initialized, but are not ready
+        # yet, since they are waiting for their finalize dependencies
+        pending = dict()
+        ready = dict(self._modules)
+        ready['score'] = self
+        lock = threading.Lock()
+        order = plan.init_order
+        try:
+            if order is None:
+                order = plan.depsolv.solve()
+            depsolv = _create_solver(
+                dict((alias, plan.dependency_map[alias]) for alias in aliases),
+                plan.dependency_aliases)
+
+            def init_module(alias, initialized):
+                if alias not in aliases:
+                    return ready[alias]
+                for dep in depsolv.direct_dependencies(alias):
+                    if dep in self._background_errors:
+                        self._fail_background(
+                            alias, self._background_errors[dep])
+                        return None
+                try:
+                    conf = plan.init_module(alias, initialized)
+                except Exception as e:
+                    log.exception('Could not initialize %s' % alias)
+                    self._fail_background(alias, e)
+                    return None
+                with lock:
+                    pending[alias] = conf
+                    self._finalize_background(
+                        pending, ready, finalize, order)
+                return conf
+
+            # each background module is initialized as soon as possible, so
+            # slow modules do not delay the others
+            _process(depsolv, init_module, max(self._workers, len(aliases)))
+            if pending:
+                # the remaining modules require each other for finalization
+                error = InitializationError(
+                    __package__, 'Could not finalize %s' % ', '.join(pending))
+                try:
+                    _create_solver(dict(
+                        (alias, [dep for dep, _ in
+                                 self._get_finalize_dependencies(alias, conf)])
+                        for alias, conf in pending.items()),
+                        self._module_dependency_aliases).solve()
+                except DependencyLoop as e:
+                    error = e
+                for alias in pending:
+                    self._fail_background(alias, error)
+            if finalize and not self._background_errors:
+                # collects the finalize dependencies of all modules for
+                # reinit() and write_plan()
+                self._prepare_finalize()
+            self._dependency_cache.save()
+        except Exception as e:
+            log.exception('Could not initialize background modules')
+            for alias in list(self._background):
+                self._fail_background(alias, e)
+        finally:
+            _publish_report(self)
+
+    def _finalize_background(self, pending, ready, finalize, order):
+        """
+        Moves all modules of the `dict` of *pending* background modules, whose
+        finalize dependencies are *ready*, to the latter `dict`, finalizing
+        them first, if *finalize* is `True`. Modules depending on a failed
+        module fail with the same error. The modules of this object are kept
+        in the initialization *order*.
+        """
+        progress = True
+        while progress:
+            progress = False
+            for alias, conf in list(pending.items()):
+                if finalize:
+                    try:
+                        dependencies = self._background_finalize_dependencies(
+                            alias, conf, ready)
+                        if dependencies is None:
+                            continue
+                        self._finalize_module(alias, conf, dependencies, ready)
+                    except Exception as e:
+                        log.exception('Could not finalize %s' % alias)
+                        del pending[alias]
+                        progress = True
+                        self._fail_background(alias, e)
+                        continue
+                del pending[alias]
+                progress = True
+                ready[alias] = conf
+                with self._background_condition:
+                    self._modules = OrderedDict(
+                        (other, ready[other])
+                        for other in order if other in ready)
+                    setattr(self, alias, conf)
+                    self._background.discard(alias)
+                    self._background_condition.notify_all()
+
+    def _background_finalize_dependencies(self, alias, conf, ready):
+        """
+        Returns the names of the finalize dependencies of the background
+        module with given *alias*, if all of them are *ready*, or `None`, if
+        some of them are still being initialized in the background. Raises
+        the exception of a failed dependency.
+        """
+        dependencies = []
+        for dep, optional in self._get_finalize_dependencies(alias, conf):
+            try:
+                dep_alias = self._module_dependency_aliases[alias][dep]
+            except KeyError:
+                dep_alias = dep
+            if dep_alias in self._background_errors:
+                raise self._background_errors[dep_alias]
+            if dep_alias in ready:
+                dependencies.append(dep)
+            elif dep_alias in self._background:
+                return None
+            elif not optional:
+                raise ConfigurationError(
+                    __package__,
+                    'Could not find the following dependencies:\n'
+                    ' - %s (required by %s)' % (dep, alias))
+        return dependencies
+
+    def _fail_background(self, alias, error):
+        """
+        Marks the background module with given *alias* as failed with given
+        *error*.
+        """
+        with self._background_condition:
+            self._background_errors[alias] = error
+            self._background.discard(alias)
+            self._background_condition.notify_all()
+
+    def _join_background(self, alias=None):
+        """
+        Waits until the module with given *alias*, that is initialized in the
+        background, is ready and raises the exception of its initialization,
+        if it failed. Waits for all background modules, if no *alias* is
+        given, and raises the exception of any failed module.
+        """
+        with self._background_condition:
+            if alias is None:
+                self._background_condition.wait_for(
+                    lambda: not self._background)
+                errors = list(self._background_errors.values())
+            else:
+                self._background_condition.wait_for(
+                    lambda: alias not in self._background)
+                errors = [self._background_errors.get(alias)]
+            if errors and errors[0] is not None:
+                raise errors[0]
+
+    def _load(self, alias):
+        """
+        Initializes the module with given *alias* from the initialization plan
+        on demand, along with all of its transitive dependencies, as well as
+        all modules required for finalizing them.
+        """
+        with self._load_lock:
+            if alias in self._modules:
+                return self._modules[alias]
+            plan = self._plan
+            pending = [alias]
+            loaded = []
+            while pending:
+                target = pending.pop()
+                aliases = plan.depsolv.transitive_dependencies(target)
+                aliases.append(target)
+                plan.report.begin('init')
+                for other in aliases:
+                    if other in self._modules:
+                        continue
+                    conf = plan.init_module(other, self._modules)
+                    self._modules[other] = conf
+                    loaded.append(other)
+                    if not self._lazy_finalize:
+                        continue
+                    finalize_dependencies = \
+                        self._get_finalize_dependencies(other, conf)
+                    for dep, _ in finalize_dependencies:
+                        try:
+                            dep = self._module_dependency_aliases[other][dep]
+                        except KeyError:
+                            pass
+                        if dep in plan.modules and dep not in self._modules:
+                            pending.append(dep)
+            if self._lazy_finalize:
+                self._finalize()
+            # other threads may only access the modules once they are
+            # finalized, until then they end up in __getattr__ and wait
+            for other in loaded:
+                setattr(self, other, self._modules[other])
+            self._dependency_cache.save()
+            _publish_report(
+                self, final=len(self._modules) == len(plan.modules))
+            return self._modules[alias]
+
+    def reinit(self, confdict, *, overrides={}, finalize=True):
+        """
+        Applies a changed *confdict* without initializing everything once
+        more: only the modules, whose configuration changed (including their
+        ``alias:`` sub-sections), are initialized again, along with all
+        modules depending on them, either in their ``init`` or in their
+        ``_finalize`` function. All other :class:`.ConfiguredModule` objects
+        remain untouched. The new objects are finalized, unless *finalize* is
+        `False`, and replace the previous ones in this object.
+
+        The *overrides* are applied just like in :func:`.init`. Since the
+        previous configuration is compared against the *confdict*, a
+        :class:`configparser.ConfigParser` or a :class:`.ConfigView` must be
+        a new object, as these are not copied. A plain `dict` may also be the
+        modified original one. The list of configured modules must not
+        change, though. Modules of a lazy object, that were not accessed yet,
+        are not initialized here, but will use the new configuration once
+        they are.
+
+        Returns the list of the re-initialized aliases in initialization
+        order.
+        """
+        self._join_background()
+        confdict = _apply_overrides(confdict, overrides)
+        if _configured_modules(confdict) != _configured_modules(self.conf):
+            raise ConfigurationError(
+                __package__,
+                'Cannot re-initialize score with a different list of modules')
+        with self._load_lock:
+            plan = self._plan
+            changed = [alias for alias in self._modules
+                       if _module_conf(self.conf, alias) !=
+                       _module_conf(confdict, alias)]
+            affected = set()
+            if plan is not None:
+                affected = self._collect_dependents(changed)
+            if not affected:
+                self.conf = confdict
+                if plan is not None:
+                    plan.confdict = confdict
+                return []
+            previous_conf, previous_modules = self.conf, self._modules
+            # the new configuration and modules are only kept, once all
+            # affected modules were initialized and finalized successfully
+            plan.confdict = confdict
+            try:
+                plan.report.begin('init')
+
+                def init_module(alias, initialized):
+                    if alias in affected:
+                        return plan.init_module(alias, initialized)
+                    return previous_modules.get(alias)
+
+                results = _process(plan.depsolv, init_module, self._workers,
+                                   plan.init_order)
+                reinitialized = [alias for alias in results
+                                 if alias in affected]
+                self._modules = OrderedDict(previous_modules)
+                for alias in reinitialized:
+                    log.debug('Replacing %s' % (alias))
+                    self._modules[alias] = results[alias]
+                if finalize:
+                    self._finalize()
+            except BaseException:
+                plan.confdict = previous_conf
+                self._modules = previous_modules
+                raise
+            self.conf = confdict
+            for alias in reinitialized:
+                setattr(self, alias, self._modules[alias])
+            self._dependency_cache.save()
+            return reinitialized
+
+    def _collect_dependents(self, aliases):
+        """
+        Returns the `set` of given initialized *aliases* and all initialized
+        modules depending on them, either through their ``init`` or their
+        ``_finalize`` function.
+        """
+        finalize_dependents = {}
+        finalize_dependency_map = getattr(
+            self, '_finalize_dependency_map', {})
+        for alias, dependencies in finalize_dependency_map.items():
+            for dep in dependencies:
+                try:
+                    dep = self._module_dependency_aliases[alias][dep]
+                except KeyError:
+                    pass
+                finalize_dependents.setdefault(dep, []).append(alias)
+        result = set()
+        pending = list(aliases)
+        while pending:
+            alias = pending.pop()
+            if alias in result or alias not in self._modules:
+                continue
+            result.add(alias)
+            pending.extend(self._plan.depsolv.direct_dependents(alias))
+            pending.extend(finalize_dependents.get(alias, []))
+        return result
+
     def _finalize(self):
+        modules, dependency_map, depsolv = self._prepare_finalize()
+        report = self._init_report
+        report.begin('finalize')
+
+        def finalize_module(alias, finalized):
+            if alias == 'score':
+                return
+            self._finalize_module(
+                alias, modules[alias], dependency_map[alias], modules)
+
+        _process(depsolv, finalize_module, self._workers,
+                 self._get_finalize_order())
+
+    def _finalize_module(self, alias, conf, dependencies, available):
+        """
+        Calls the ``_finalize`` function of the module with given *alias* and
+        :class:`.ConfiguredModule` *conf*. The given *dependencies* are the
+        names of the function's parameters, whose values are taken from the
+        `dict` of *available* modules. Does nothing, if the module was
+        already finalized.
+        """
+        if not self._claim_finalize(conf):
+            return
+        finalized = False
+        try:
+            log.debug('Finalizing %s' % (alias))
+            kwargs = _dependency_kwargs(
+                alias, dependencies, self._module_dependency_aliases,
+                available)
+            dependency_aliases = self._module_dependency_aliases.get(alias, {})
+            report_dependencies = [dependency_aliases.get(dep, dep)
+                                   for dep in dependencies if dep != 'score']
+            with self._init_report.measure('finalize', alias,
+                                           report_dependencies):
+                result = conf._finalize(**kwargs)
+            if inspect.isawaitable(result):
+                if inspect.iscoroutine(result):
+                    result.close()
+                raise InitializationError(
+                    __package__,
+                    '%s finalizer is a coroutine function, '
+                    'use init_async() to finalize it' % (alias,))
+            finalized = True
+        finally:
+            self._release_finalize(conf, finalized)
+
+    def _claim_finalize(self, conf):
+        """
+        Claims the finalization of given :class:`.ConfiguredModule` for the
+        current thread. Waits, if another thread is finalizing the module.
+        Returns `False`, if the module is finalized already.
+        """
+        with self._finalize_condition:
+            self._finalize_condition.wait_for(
+                lambda: id(conf) not in self._finalizing)
+            if conf._finalized:
+                return False
+            self._finalizing.add(id(conf))
+            return True
+
+    def _release_finalize(self, conf, finalized):
+        """
+        Releases the claim acquired with :meth:`_claim_finalize`, marking the
+        module as *finalized*, if its ``_finalize`` succeeded.
+        """
+        with self._finalize_condition:
+            if finalized:
+                conf._finalized = True
+            self._finalizing.discard(id(conf))
+            self._finalize_condition.notify_all()
+
+    async def _finalize_async(self):
+        """
+        Coroutine variant of :meth:`_finalize`, which awaits the finalizers of
+        all modules, that are coroutine functions. Used by :func:`.init_async`.
+        """
+        modules, dependency_map, depsolv = self._prepare_finalize()
+        report = self._init_report
+        report.begin('finalize')
+
+        async def finalize_module(alias, finalized):
+            if alias == 'score':
+                return
+            conf = modules[alias]
+            if not self._claim_finalize(conf):
+                return
+            success = False
+            try:
+                log.debug('Finalizing %s' % (alias))
+                kwargs = _dependency_kwargs(
+                    alias, dependency_map[alias],
+                    self._module_dependency_aliases, modules)
+                with report.measure('finalize', alias,
+                                    depsolv.direct_dependencies(alias)):
+                    result = conf._finalize(**kwargs)
+                    if inspect.isawaitable(result):
+                        await result
+                success = True
+            finally:
+                self._release_finalize(conf, success)
+
+        await _process_async(depsolv, finalize_module)
+
+    def _prepare_finalize(self):
+        """
+        Collects the finalization dependencies of all modules. Returns the
+        `dict` of all modules (including this object as ``score``), the
+        dependency map and a :class:`.DependencySolver` for the finalization
+        order.
+        """
         dependency_map = {}
         for alias, conf in self._modules.items():
-            module_dependencies = []
-            if hasattr(conf, '_finalize_dependencies'):
-                if isinstance(conf._finalize_dependencies, dict):
-                    module_dependencies = conf._finalize_dependencies
-                else:
-                    module_dependencies = \
-                        [(dep, True) for dep in conf._finalize_dependencies]
-            else:
-                sig = signature(conf._finalize)
-                for i, (param_name, param) in enumerate(sig.parameters.items()):
-                    module_dependencies.append(
-                        (param_name, param.default != Parameter.empty))
-            dependency_map[alias] = module_dependencies
+            dependency_map[alias] = \
+                self._get_finalize_dependencies(alias, conf)
         modules = self._modules.copy()
         modules['score'] = self
         _remove_missing_optional_dependencies(
             modules, dependency_map, self._module_dependency_aliases)
-        sorted_aliases = _sort_modules(
-            dependency_map, self._module_dependency_aliases, 'finalization')
-        for alias in sorted_aliases:
-            if alias == 'score':
-                continue
-            kwargs = {}
-            for dep in dependency_map[alias]:
-                try:
-                    depalias = self._module_dependency_aliases[alias][dep]
-                except KeyError:
-                    kwargs[dep] = modules[dep]
-                else:
-                    kwargs[dep] = modules[depalias]
-            log.debug('Finalizing %s' % (alias))
-            conf = modules[alias]
-            conf._finalize(**kwargs)
-            conf._finalized = True
+        depsolv = _create_solver(
+            dependency_map, self._module_dependency_aliases)
+        self._finalize_dependency_map = dependency_map
+        return modules, dependency_map, depsolv
+
+    def _get_finalize_order(self):
+        """
+        Returns the finalization order stored in the initialization plan, if
+        it covers exactly the initialized modules, or `None` otherwise.
+        """
+        if self._plan is None or self._plan.finalize_order is None:
+            return None
+        order = self._plan.finalize_order
+        if set(order) != set(self._modules):
+            return None
+        return order
+
+    def _get_finalize_dependencies(self, alias, conf):
+        """
+        Returns the finalize dependencies of the module with given *alias*,
+        preferring the declaration in its :class:`.Manifest`.
+        """
+        if self._plan is not None and alias in self._plan.finalize_map:
+            return self._plan.finalize_map[alias]
+        return _finalize_dependencies(conf, self._dependency_cache)
+
+
+def _finalize_dependencies(conf, cache=None):
+    """
+    Returns the dependencies of the ``_finalize`` function of given
+    :class:`.ConfiguredModule` as a list of tuples, each containing the name of
+    the dependency and a boolean indicating whether it is optional. Signatures
+    are inspected through the given :class:`.DependencyCache`.
+    """
+    module_dependencies = []
+    if hasattr(conf, '_finalize_dependencies'):
+        if isinstance(conf._finalize_dependencies, dict):
+            module_dependencies = list(conf._finalize_dependencies.items())
+        else:
+            module_dependencies = \
+                [(dep, True) for dep in conf._finalize_dependencies]
+    else:
+        if cache is None:
+            cache = DependencyCache()
+        module_dependencies = cache.dependencies(conf._finalize)
+    return module_dependencies
+
+
+def _configured_modules(confdict):
+    """
+    Returns the list of module configurations in the value ``modules`` of the
+    ``score.init`` section of given *confdict*.
+    """
+    try:
+        return parse_list(confdict['score.init']['modules'])
+    except KeyError:
+        return []
 
 
 def _collect_modules(modconf):
     modules = OrderedDict()
     dependency_aliases = {}
+    background = set()
     for line in modconf:
         parts = line.split(':', 2)
         if len(parts) == 2:
@@ -294,10 +1559,13 @@ def _collect_modules(modconf):
                 module = module[:module.index('(')].strip()
             dependency_aliases[alias] = {}
             for assignment in assignments:
+                if assignment.strip() == 'background':
+                    background.add(alias)
+                    continue
                 key, value = assignment.split('=')
                 dependency_aliases[alias][key.strip()] = value.strip()
         modules[alias] = module
-    return modules, dependency_aliases
+    return modules, dependency_aliases, background
 
 
 def _import(module_name):
@@ -313,33 +1581,68 @@ def _import(module_name):
     return None
 
 
-def _collect_dependencies(modules, dependency_aliases):
+def _collect_dependencies(modules, dependency_aliases, report=None,
+                          cache=None, manifests=None, only=None):
+    """
+    Returns the dependencies of the ``init`` functions of given *modules*.
+    Packages declaring their dependencies in a :class:`.Manifest` are not
+    imported, their manifests are added to the `dict` of *manifests* instead.
+
+    If a list of aliases is given as *only*, just these modules and their
+    transitive dependencies are inspected. All other modules are removed from
+    the `dict` of *modules*.
+    """
+    if report is None:
+        report = InitReport()
+    if cache is None:
+        cache = DependencyCache()
+    if manifests is None:
+        manifests = {}
+    if only is None:
+        pending = list(modules)
+    else:
+        unknown = [alias for alias in only if alias not in modules]
+        if unknown:
+            raise ConfigurationError(
+                __package__,
+                'Cannot initialize the following unconfigured modules:\n - ' +
+                '\n - '.join(unknown))
+        pending = list(OrderedDict.fromkeys(only))
+    selected = set(pending)
     missing = []
     dependency_map = {}
-    for alias, modname in modules.items():
+    # the list of pending aliases grows while iterating, if *only* is given
+    for alias in pending:
+        modname = modules[alias]
         if modname == 'score.init':
             continue
-        module = _import(modname)
-        if not module:
-            missing.append(modname)
-            continue
-        if not hasattr(module, 'init'):
-            raise InitializationError(
-                __package__,
-                'Cannot initialize %s: it has no init() function' % modname)
-        if not callable(module.init):
-            raise InitializationError(
-                __package__,
-                'Cannot initialize %s: its init is not a function' % modname)
-        module_dependencies = []
-        sig = signature(module.init)
-        for i, (param_name, param) in enumerate(sig.parameters.items()):
-            if i == 0:
-                # this should be the confdict
+        manifest = read_manifest(modname)
+        if manifest is not None:
+            manifests[alias] = manifest
+            dependency_map[alias] = manifest.init_dependencies
+        else:
+            with report.measure('import', alias):
+                module = _import(modname)
+            if not module:
+                missing.append(modname)
                 continue
-            module_dependencies.append(
-                (param_name, param.default != Parameter.empty))
-        dependency_map[alias] = module_dependencies
+            _check_init_function(modname, module)
+            # the first parameter should be the confdict
+            dependency_map[alias] = cache.dependencies(module.init, skip=1)
+        if only is None:
+            continue
+        for dep, _ in dependency_map[alias]:
+            try:
+                dep = dependency_aliases[alias][dep]
+            except KeyError:
+                pass
+            if dep in modules and dep not in selected:
+                selected.add(dep)
+                pending.append(dep)
+    if only is not None:
+        for alias in list(modules):
+            if alias not in selected:
+                del modules[alias]
     if missing:
         raise ConfigurationError(
             __package__,
@@ -350,6 +1653,17 @@ def _collect_dependencies(modules, dependency_aliases):
     return dependency_map
 
 
+def _check_init_function(modname, module):
+    if not hasattr(module, 'init'):
+        raise InitializationError(
+            __package__,
+            'Cannot initialize %s: it has no init() function' % modname)
+    if not callable(module.init):
+        raise InitializationError(
+            __package__,
+            'Cannot initialize %s: its init is not a function' % modname)
+
+
 def _remove_missing_optional_dependencies(modules, dependency_map,
                                           dependency_aliases):
     missing = {}
@@ -382,6 +1696,10 @@ def _remove_missing_optional_dependencies(modules, dependency_map,
 
 
 def _sort_modules(dependency_map, dependency_aliases, operation):
+    return _create_solver(dependency_map, dependency_aliases).solve()
+
+
+def _create_solver(dependency_map, dependency_aliases):
     depsolv = DependencySolver()
     for alias, module_dependencies in dependency_map.items():
         depsolv.add(alias)
@@ -391,4 +1709,4 @@ def _sort_modules(dependency_map, dependency_aliases, operation):
             if alias in dependency_aliases and dep in dependency_aliases[alias]:
                 dep = dependency_aliases[alias][dep]
             depsolv.add(alias, dep)
-    return depsolv.solve()
+    return depsolv
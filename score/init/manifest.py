@@ -0,0 +1,105 @@
+# vim: set fileencoding=UTF-8
+# Copyright © 2015-2018 STRG.AT GmbH, Vienna, Austria
+#
+# This file is part of the The SCORE Framework.
+#
+# The SCORE Framework and all its parts are free software: you can redistribute
+# them and/or modify them under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation which is in the
+# file named COPYING.LESSER.txt.
+#
+# The SCORE Framework and all its parts are distributed without any WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. For more details see the GNU Lesser General Public
+# License.
+#
+# If you have not received a copy of the GNU Lesser General Public License see
+# http://www.gnu.org/licenses/.
+#
+# The License-Agreement realised between you as Licensee and STRG.AT GmbH as
+# Licenser including the issue of its valid conclusion and its pre- and
+# post-contractual effects is governed by the laws of Austria. Any disputes
+# concerning this License-Agreement including the issue of its valid conclusion
+# and its pre- and post-contractual effects are exclusively decided by the
+# competent court, in whose district STRG.AT GmbH has its registered seat, at
+# the discretion of STRG.AT GmbH also the competent court, in whose district the
+# Licensee has his registered seat, an establishment or assets.
+
+import configparser
+import importlib.util
+import os
+from .config import parse_list
+from .exceptions import ConfigurationError
+
+
+class Manifest:
+    """
+    Static declaration of the dependencies of a module, read from a file
+    called :file:`__score__` in the folder of the module's package. This
+    allows resolving the initialization order without importing the module::
+
+        [init]
+        requires =
+            db
+            ctx
+        optional = http
+
+        [finalize]
+        requires = db
+
+    Both sections are optional: if the ``init`` section is missing, the
+    module has no init dependencies. If the ``finalize`` section is missing,
+    its finalize dependencies are determined the usual way, once the module
+    was initialized.
+
+    The ``init`` section is checked against the signature of the module's
+    ``init`` function once the module was imported: a
+    :class:`.ConfigurationError` is raised, if they do not match.
+
+    The members *init_dependencies* and *finalize_dependencies* contain lists
+    of tuples, each containing the name of the dependency and a boolean
+    indicating whether it is optional. The latter is `None`, if the file has
+    no ``finalize`` section.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        parser = configparser.ConfigParser()
+        try:
+            with open(file) as fp:
+                parser.read_file(fp)
+        except configparser.Error as e:
+            import score.init
+            raise ConfigurationError(
+                score.init, 'Invalid manifest %s' % file) from e
+        self.init_dependencies = self._read(parser, 'init') or []
+        self.finalize_dependencies = self._read(parser, 'finalize')
+
+    def _read(self, parser, section):
+        if section not in parser:
+            return None
+        return (
+            [(dep, False)
+             for dep in parse_list(parser[section].get('requires', ''))] +
+            [(dep, True)
+             for dep in parse_list(parser[section].get('optional', ''))])
+
+
+def read_manifest(modname):
+    """
+    Returns the :class:`.Manifest` of the package with given *modname*, or
+    `None` if the package has no :file:`__score__` file. Only the parent
+    packages of the module are imported for this purpose, if the package
+    has not been imported already.
+    """
+    try:
+        spec = importlib.util.find_spec(modname)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    for location in spec.submodule_search_locations:
+        file = os.path.join(location, '__score__')
+        if os.path.isfile(file):
+            return Manifest(file)
+    return None
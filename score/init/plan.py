@@ -0,0 +1,219 @@
+# vim: set fileencoding=UTF-8
+# Copyright © 2015-2018 STRG.AT GmbH, Vienna, Austria
+#
+# This file is part of the The SCORE Framework.
+#
+# The SCORE Framework and all its parts are free software: you can redistribute
+# them and/or modify them under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation which is in the
+# file named COPYING.LESSER.txt.
+#
+# The SCORE Framework and all its parts are distributed without any WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. For more details see the GNU Lesser General Public
+# License.
+#
+# If you have not received a copy of the GNU Lesser General Public License see
+# http://www.gnu.org/licenses/.
+#
+# The License-Agreement realised between you as Licensee and STRG.AT GmbH as
+# Licenser including the issue of its valid conclusion and its pre- and
+# post-contractual effects is governed by the laws of Austria. Any disputes
+# concerning this License-Agreement including the issue of its valid conclusion
+# and its pre- and post-contractual effects are exclusively decided by the
+# competent court, in whose district STRG.AT GmbH has its registered seat, at
+# the discretion of STRG.AT GmbH also the competent court, in whose district the
+# Licensee has his registered seat, an establishment or assets.
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sys
+from collections import OrderedDict
+from .config import parse_list, parse_config_file
+from .exceptions import ConfigurationError
+from .initializer import (
+    init, init_from_file, _prepare_confdict, _get_option, _run_plan,
+    _InitPlan, _create_solver, _create_dependency_cache,
+    _create_timing_cache)
+from .report import InitReport
+
+
+log = logging.getLogger(__name__)
+
+PLAN_VERSION = 3
+
+
+def compile_plan(file, planfile, *, overrides={}):
+    """
+    Initializes score from given configuration *file* (see
+    :func:`.init_from_file`) and stores the resulting initialization plan in
+    *planfile*. See :func:`.init_from_plan` for details.
+
+    Note that the initialization is performed once to determine the
+    finalization dependencies of all modules. Returns the resulting
+    :class:`.ConfiguredScore`.
+    """
+    score = init_from_file(file, overrides=overrides, init_logging=False)
+    write_plan(score, planfile, file, overrides=overrides)
+    return score
+
+
+def init_from_plan(planfile, file=None, *, overrides={}, init_logging=True,
+                   finalize=True, workers=None):
+    """
+    Initializes score using the plan stored in *planfile*, which was created
+    by :func:`.compile_plan` (or an earlier call to this function). The plan
+    contains the whole configuration, as well as the dependencies and the
+    initialization and finalization orders of all modules, so neither the
+    configuration files need to be parsed, nor the dependencies of the
+    modules inspected and solved.
+
+    The plan also contains hashes of all configuration files and of the files
+    of all configured modules. If any of these files changed, if the plan was
+    compiled from another configuration *file*, or if the *planfile* does
+    not exist, the plan is considered stale: this function
+    will then initialize score from given configuration *file* instead and
+    write a new plan. If no *file* was given in that case, a
+    :class:`.ConfigurationError` is raised.
+
+    All other arguments are the same as those of :func:`.init`.
+    """
+    data = _load_plan(planfile, file, overrides)
+    if data is None:
+        if file is None:
+            import score.init
+            raise ConfigurationError(
+                score.init,
+                'Initialization plan %s is missing or stale' % planfile)
+        log.info('Rebuilding initialization plan %s' % planfile)
+        confdict = parse_config_file(file, return_configparser=init_logging)
+        score = init(confdict, overrides=overrides, init_logging=init_logging,
+                     finalize=finalize, workers=workers)
+        write_plan(score, planfile, file, overrides=overrides)
+        return score
+    report = InitReport()
+    confdict = _prepare_confdict(data['confdict'], {}, init_logging, report)
+    if workers is None:
+        workers = _get_option(confdict, 'workers', int, 0)
+    dependency_aliases = data['dependency_aliases']
+    dependency_map = data['dependency_map']
+    plan = _InitPlan(
+        confdict, data['modules'], dependency_aliases, dependency_map,
+        report, _create_dependency_cache(confdict),
+        dict((alias, [(dep, False) for dep in dependencies])
+             for alias, dependencies in data['finalize_map'].items()),
+        init_order=data['init_order'],
+        finalize_order=data['finalize_order'],
+        background=data['background'],
+        timings=_create_timing_cache(confdict))
+    return _run_plan(plan, finalize, workers)
+
+
+def write_plan(score, planfile, file, *, overrides={}):
+    """
+    Stores the initialization plan of given :class:`.ConfiguredScore` in
+    *planfile*. The configuration *file* and the *overrides* are the ones
+    *score* was initialized with. The finalization dependencies of the
+    modules are inspected without finalizing them, if *score* was
+    initialized with ``finalize=False``.
+    """
+    plan = score._plan
+    if plan is None:
+        return
+    if score._lazy:
+        log.warning('Not writing initialization plan %s: the modules are '
+                    'initialized lazily' % planfile)
+        return
+    score._join_background()
+    if not hasattr(score, '_finalize_dependency_map'):
+        score._prepare_finalize()
+    sources = [os.path.abspath(file)]
+    try:
+        sources.extend(parse_list(score.conf['score.init']['_files']))
+    except KeyError:
+        pass
+    for modname in plan.modules.values():
+        module = sys.modules.get(modname)
+        if getattr(module, '__file__', None) is None:
+            continue
+        sources.append(module.__file__)
+        # the init function might be defined in another file of the module
+        init_file = getattr(
+            getattr(inspect.unwrap(module.init), '__code__', None),
+            'co_filename', None)
+        if init_file is not None and os.path.isfile(init_file):
+            sources.append(init_file)
+        manifest = os.path.join(os.path.dirname(module.__file__), '__score__')
+        if os.path.isfile(manifest):
+            sources.append(manifest)
+    # the finalize dependencies are determined by the ConfiguredModule
+    # classes, which might be defined anywhere
+    for conf in score._modules.values():
+        for obj in (type(conf), inspect.unwrap(conf._finalize)):
+            try:
+                source = inspect.getsourcefile(obj)
+            except TypeError:
+                continue
+            if source is not None and os.path.isfile(source):
+                sources.append(source)
+    data = {
+        'version': PLAN_VERSION,
+        'file': os.path.abspath(file),
+        'sources': dict((source, _hash_file(source))
+                        for source in OrderedDict.fromkeys(sources)),
+        'overrides': _hash_overrides(overrides),
+        'confdict': dict((section, dict(values))
+                         for section, values in score.conf.items()),
+        'modules': plan.modules,
+        'dependency_aliases': plan.dependency_aliases,
+        'dependency_map': plan.dependency_map,
+        'background': sorted(plan.background),
+        'finalize_map': score._finalize_dependency_map,
+        'init_order': list(score._modules),
+        'finalize_order': _create_solver(
+            score._finalize_dependency_map,
+            plan.dependency_aliases).solve(),
+    }
+    tmpfile = '%s.%d' % (planfile, os.getpid())
+    with open(tmpfile, 'w') as fp:
+        json.dump(data, fp, indent=1)
+    os.replace(tmpfile, planfile)
+
+
+def _load_plan(planfile, file, overrides):
+    """
+    Returns the contents of given *planfile*, or `None` if the file is
+    missing, was created by another version of this module, was compiled
+    from another configuration *file*, or any of its sources changed.
+    """
+    try:
+        with open(planfile) as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if data.get('version') != PLAN_VERSION:
+        return None
+    if file is not None and data['file'] != os.path.abspath(file):
+        return None
+    if data['overrides'] != _hash_overrides(overrides):
+        return None
+    for source, digest in data['sources'].items():
+        try:
+            if _hash_file(source) != digest:
+                return None
+        except OSError:
+            return None
+    return data
+
+
+def _hash_file(file):
+    with open(file, 'rb') as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+
+def _hash_overrides(overrides):
+    return hashlib.sha256(json.dumps(
+        overrides, sort_keys=True).encode('UTF-8')).hexdigest()
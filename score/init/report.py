@@ -0,0 +1,463 @@
+# vim: set fileencoding=UTF-8
+# Copyright © 2015-2018 STRG.AT GmbH, Vienna, Austria
+#
+# This file is part of the The SCORE Framework.
+#
+# The SCORE Framework and all its parts are free software: you can redistribute
+# them and/or modify them under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation which is in the
+# file named COPYING.LESSER.txt.
+#
+# The SCORE Framework and all its parts are distributed without any WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. For more details see the GNU Lesser General Public
+# License.
+#
+# If you have not received a copy of the GNU Lesser General Public License see
+# http://www.gnu.org/licenses/.
+#
+# The License-Agreement realised between you as Licensee and STRG.AT GmbH as
+# Licenser including the issue of its valid conclusion and its pre- and
+# post-contractual effects is governed by the laws of Austria. Any disputes
+# concerning this License-Agreement including the issue of its valid conclusion
+# and its pre- and post-contractual effects are exclusively decided by the
+# competent court, in whose district STRG.AT GmbH has its registered seat, at
+# the discretion of STRG.AT GmbH also the competent court, in whose district the
+# Licensee has his registered seat, an establishment or assets.
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+
+# the CPU time of the current thread is only available since Python 3.7,
+# earlier versions measure the CPU time of the whole process instead
+_thread_time = getattr(time, 'thread_time', time.process_time)
+
+
+class ModuleReport:
+    """
+    Timing information of a single module, as collected by
+    :class:`.InitReport`. All values are in seconds and `None`, if the
+    respective phase did not happen (yet).
+
+    The *wait_time* values describe how long the module had to wait for its
+    dependencies, i.e. the time between the start of the phase and the moment
+    the last dependency completed.
+
+    The *memory* values are only collected if memory profiling was enabled.
+    They are tuples containing the number of bytes and the number of memory
+    blocks, that were allocated during the phase and were still alive at its
+    end.
+    """
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.import_time = None
+        self.init_time = None
+        self.init_cpu_time = None
+        self.init_wait_time = None
+        self.finalize_time = None
+        self.finalize_cpu_time = None
+        self.finalize_wait_time = None
+        self.import_memory = None
+        self.init_memory = None
+        self.finalize_memory = None
+        # maps phases to tuples containing the start and end timestamps, as
+        # well as the id of the thread that was running the phase
+        self.spans = OrderedDict()
+        # maps phases to the aliases of modules, that needed to complete the
+        # same phase first
+        self.dependencies = dict()
+
+
+class InitReport:
+    """
+    Collects timing information for each module during :func:`.init`. The
+    report of an initialization is available as ``_init_report`` of the
+    resulting :class:`.ConfiguredScore`. Its member *modules* maps module
+    aliases to their respective :class:`.ModuleReport`.
+    """
+
+    def __init__(self, *, profile_imports=False, profile_memory=False):
+        self.modules = OrderedDict()
+        self.origins = dict()
+        self.profile_imports = profile_imports
+        self.profile_memory = False
+        self._started_tracemalloc = False
+        if profile_memory:
+            self.start_memory_profiling()
+        # maps names of python modules to tuples containing the alias, that
+        # triggered the import, the cumulative and the self time of the import
+        self.imports = OrderedDict()
+        self._lock = threading.Lock()
+
+    def module(self, alias):
+        """
+        Returns the :class:`.ModuleReport` of given *alias*, creating it if
+        necessary.
+        """
+        with self._lock:
+            try:
+                return self.modules[alias]
+            except KeyError:
+                self.modules[alias] = ModuleReport(alias)
+                return self.modules[alias]
+
+    def begin(self, phase):
+        """
+        Marks the start of given *phase*, i.e. 'import', 'init' or
+        'finalize'. The wait times of the phase are relative to this point.
+        """
+        self.origins[phase] = time.perf_counter()
+
+    @contextmanager
+    def measure(self, phase, alias, dependencies=()):
+        """
+        A context manager measuring the wall and CPU time of given *phase* of
+        the module with given *alias*. The *dependencies* are the aliases of
+        all modules, that needed to complete the same phase before this one.
+        """
+        record = self.module(alias)
+        if self.profile_memory:
+            snapshot = self._snapshot()
+        start = time.perf_counter()
+        cpu_start = _thread_time()
+        try:
+            if phase == 'import':
+                with self.profiling_imports(alias):
+                    yield record
+            else:
+                yield record
+        finally:
+            end = time.perf_counter()
+            cpu_time = _thread_time() - cpu_start
+            record.spans[phase] = (start, end, threading.get_ident())
+            record.dependencies[phase] = list(dependencies)
+            if self.profile_memory:
+                stats = self._snapshot().compare_to(snapshot, 'filename')
+                setattr(record, phase + '_memory', (
+                    sum(stat.size_diff for stat in stats),
+                    sum(stat.count_diff for stat in stats)))
+            setattr(record, phase + '_time', end - start)
+            # imports have no cpu and wait times. Returning early is not an
+            # option here, as it would swallow exceptions of the with block
+            if phase != 'import':
+                setattr(record, phase + '_cpu_time', cpu_time)
+                origin = self.origins.get(phase, start)
+                ready = origin
+                for dep in dependencies:
+                    try:
+                        ready = max(ready, self.modules[dep].spans[phase][1])
+                    except KeyError:
+                        pass
+                setattr(record, phase + '_wait_time', ready - origin)
+
+    def summary(self):
+        """
+        Returns a human readable table of all collected timings in
+        milliseconds.
+        """
+        columns = ('import', 'init', 'init_cpu', 'init_wait',
+                   'finalize', 'finalize_cpu', 'finalize_wait')
+        width = max([len('module')] + [len(alias) for alias in self.modules])
+        lines = ['%-*s' % (width, 'module') + ''.join(
+            ' %13s' % column for column in columns)]
+        for alias, record in self.modules.items():
+            values = []
+            for column in columns:
+                value = getattr(record, column + '_time')
+                if value is None:
+                    values.append(' %13s' % '-')
+                else:
+                    values.append(' %13.1f' % (value * 1000))
+            lines.append('%-*s' % (width, alias) + ''.join(values))
+        return '\n'.join(lines)
+
+    def trace_events(self):
+        """
+        Converts the collected timings into a list of events in the `Trace
+        Event Format`_, as understood by ``chrome://tracing`` and Perfetto.
+        Each import, init and finalize call is represented by a complete event
+        on the thread, that performed the call. The dependencies between
+        modules are represented by flow events.
+
+        .. _Trace Event Format: https://docs.google.com/document/d/
+            1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKyarnkBw
+        """
+        spans = [span for record in self.modules.values()
+                 for span in record.spans.values()]
+        if not spans:
+            return []
+        origin = min(span[0] for span in spans)
+        pid = os.getpid()
+
+        def timestamp(value):
+            return round((value - origin) * 1e6, 3)
+
+        events = [{
+            'name': 'process_name', 'ph': 'M', 'pid': pid,
+            'args': {'name': 'score.init'},
+        }]
+        flow_id = 0
+        for alias, record in self.modules.items():
+            for phase, (start, end, thread) in record.spans.items():
+                dependencies = record.dependencies.get(phase, [])
+                events.append({
+                    'name': '%s %s' % (phase, alias),
+                    'cat': phase,
+                    'ph': 'X',
+                    'ts': timestamp(start),
+                    'dur': timestamp(end) - timestamp(start),
+                    'pid': pid,
+                    'tid': thread,
+                    'args': {'alias': alias, 'dependencies': dependencies},
+                })
+                for dep in dependencies:
+                    try:
+                        dep_end, dep_thread = \
+                            self.modules[dep].spans[phase][1:]
+                    except KeyError:
+                        continue
+                    flow_id += 1
+                    events.append({
+                        'name': 'dependency', 'cat': phase, 'ph': 's',
+                        'id': flow_id, 'ts': timestamp(dep_end),
+                        'pid': pid, 'tid': dep_thread,
+                    })
+                    events.append({
+                        'name': 'dependency', 'cat': phase, 'ph': 'f',
+                        'bp': 'e', 'id': flow_id, 'ts': timestamp(start),
+                        'pid': pid, 'tid': thread,
+                    })
+        return events
+
+    def write_trace(self, file):
+        """
+        Writes the :meth:`trace_events` to given *file* in JSON format.
+        """
+        with open(file, 'w') as fp:
+            json.dump({'traceEvents': self.trace_events(),
+                       'displayTimeUnit': 'ms'}, fp)
+
+    def start_memory_profiling(self):
+        """
+        Enables the collection of the *memory* values of each
+        :class:`.ModuleReport`, starting :mod:`tracemalloc` if necessary.
+
+        The measurements are based on snapshots of all memory blocks traced by
+        :mod:`tracemalloc`, so they are only accurate, if modules are
+        processed one after the other.
+        """
+        self.profile_memory = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop_memory_profiling(self):
+        """
+        Disables the memory profiling and stops :mod:`tracemalloc`, if it was
+        started by :meth:`start_memory_profiling`.
+        """
+        self.profile_memory = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _snapshot(self):
+        # collect garbage first: objects, that are already unreachable, would
+        # otherwise be attributed to the phase, in which they happen to be
+        # collected
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    def memory_summary(self):
+        """
+        Returns a human readable table of the memory still allocated after
+        each phase of each module, in kilobytes and allocated blocks.
+        """
+        columns = ('import', 'init', 'finalize')
+        width = max([len('module')] + [len(alias) for alias in self.modules])
+        lines = ['%-*s' % (width, 'module') + ''.join(
+            ' %13s %13s' % (column + '_kb', column + '_blocks')
+            for column in columns)]
+        for alias, record in self.modules.items():
+            values = []
+            for column in columns:
+                value = getattr(record, column + '_memory')
+                if value is None:
+                    values.append(' %13s %13s' % ('-', '-'))
+                else:
+                    values.append(' %13.1f %13d' % (value[0] / 1024, value[1]))
+            lines.append('%-*s' % (width, alias) + ''.join(values))
+        return '\n'.join(lines)
+
+    @contextmanager
+    def profiling_imports(self, alias):
+        """
+        A context manager attributing all python modules imported within its
+        body to given *alias*, if *profile_imports* is enabled. The timings of
+        each imported module are stored in *imports*.
+        """
+        if not self.profile_imports:
+            yield
+            return
+        profiler = _ImportProfiler.acquire()
+        contexts = profiler.contexts()
+        contexts.append((self, alias))
+        try:
+            yield
+        finally:
+            contexts.pop()
+            _ImportProfiler.release()
+
+    def import_summary(self, limit=20):
+        """
+        Returns a human readable table of the *limit* python modules with the
+        highest self time (in milliseconds) collected while *profile_imports*
+        was enabled.
+        """
+        imports = sorted(self.imports.items(),
+                         key=lambda item: item[1][2], reverse=True)[:limit]
+        width = max([len('module')] + [len(name) for name, _ in imports])
+        alias_width = max([len('alias')] +
+                          [len(str(record[0])) for _, record in imports])
+        lines = ['%-*s %-*s %13s %13s' % (
+            width, 'module', alias_width, 'alias', 'self', 'cumulative')]
+        for name, (alias, cumulative, self_time) in imports:
+            lines.append('%-*s %-*s %13.1f %13.1f' % (
+                width, name, alias_width, alias, self_time * 1000,
+                cumulative * 1000))
+        return '\n'.join(lines)
+
+
+class _ImportProfiler:
+    """
+    A meta path finder measuring the execution time of every python module
+    imported while it is installed. It delegates the actual search to the
+    other finders in :data:`sys.meta_path` and wraps the loaders they return
+    with a :class:`_TimingLoader`.
+
+    A single instance is shared by the whole process: it is installed by the
+    first call to :meth:`acquire` and removed by the matching last call to
+    :meth:`release`. Imports are attributed to the innermost
+    ``(report, alias)`` pair in the :meth:`contexts` of the importing thread;
+    imports of threads without such a context are left untouched.
+    """
+
+    _lock = threading.Lock()
+    _instance = None
+    _users = 0
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @classmethod
+    def acquire(cls):
+        """
+        Installs the shared profiler, if necessary, and returns it.
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                sys.meta_path.insert(0, cls._instance)
+            cls._users += 1
+            return cls._instance
+
+    @classmethod
+    def release(cls):
+        """
+        Removes the shared profiler once every :meth:`acquire` was released.
+        """
+        with cls._lock:
+            cls._users -= 1
+            if not cls._users:
+                sys.meta_path.remove(cls._instance)
+                cls._instance = None
+
+    def find_spec(self, fullname, path, target=None):
+        if not self.contexts() or getattr(self._local, 'finding', False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+        if spec.loader is None or not hasattr(spec.loader, 'exec_module') \
+                or isinstance(spec.loader, _TimingLoader):
+            return spec
+        spec.loader = _TimingLoader(spec.loader, self)
+        return spec
+
+    def contexts(self):
+        """
+        Returns the stack of ``(report, alias)`` pairs of the current thread.
+        """
+        try:
+            return self._local.contexts
+        except AttributeError:
+            self._local.contexts = []
+            return self._local.contexts
+
+    def stack(self):
+        """
+        Returns the stack of the current thread, containing the accumulated
+        time of the nested imports of every module being executed.
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+
+class _TimingLoader:
+    """
+    Wraps a *loader* and measures the time spent executing the modules it
+    loads. Restores the original loader on the module afterwards.
+    """
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        report, alias = self._profiler.contexts()[-1]
+        stack = self._profiler.stack()
+        stack.append(0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            module.__loader__ = self._loader
+            if getattr(module, '__spec__', None) is not None:
+                module.__spec__.loader = self._loader
+            with report._lock:
+                report.imports[module.__name__] = (
+                    alias, cumulative, cumulative - nested)
@@ -45,6 +45,7 @@ setup(
     packages=['score', 'score.init', 'score.init.config'],
     namespace_packages=['score'],
     license='LGPL',
+    python_requires='>=3.5',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Environment :: Console',
@@ -54,7 +55,6 @@ setup(
             'Public License v3 or later (LGPLv3+)',
         'Operating System :: OS Independent',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Topic :: Software Development :: Libraries :: Application Frameworks',
     ],
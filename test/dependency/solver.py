@@ -0,0 +1,162 @@
+import pytest
+from score.init import DependencySolver, DependencyLoop
+
+
+def test_solve_is_repeatable():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.add('b', 'c')
+    assert solver.solve() == ['c', 'b', 'a']
+    assert solver.solve() == ['c', 'b', 'a']
+    assert solver.direct_dependencies('a') == ['b']
+
+
+def test_solve_result_is_a_copy():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.solve().append('x')
+    assert solver.solve() == ['b', 'a']
+
+
+def test_solve_after_modification():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    assert solver.solve() == ['b', 'a']
+    solver.add('b', 'a')
+    with pytest.raises(DependencyLoop):
+        solver.solve()
+    with pytest.raises(DependencyLoop):
+        solver.solve()
+    solver.remove_dependency('a', 'b')
+    assert solver.solve() == ['a', 'b']
+
+
+def test_direct_dependents():
+    solver = DependencySolver()
+    solver.add('a', 'c')
+    solver.add('b', 'c')
+    solver.add('c', 'd')
+    assert sorted(solver.direct_dependents('c')) == ['a', 'b']
+    assert solver.direct_dependents('d') == ['c']
+    assert solver.direct_dependents('a') == []
+    solver.remove_dependency('a', 'c')
+    assert solver.direct_dependents('c') == ['b']
+
+
+def test_transitive_queries():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.add('b', 'c')
+    solver.add('x', 'c')
+    solver.add('y')
+    assert solver.transitive_dependencies('a') == ['c', 'b']
+    assert solver.transitive_dependencies('c') == []
+    assert sorted(solver.transitive_dependents('c')) == ['a', 'b', 'x']
+    assert solver.transitive_dependents('y') == []
+    assert solver.transitive_dependencies('unknown') == []
+    solver.remove_dependency('b', 'c')
+    assert solver.transitive_dependencies('a') == ['b']
+    assert solver.transitive_dependents('c') == ['x']
+
+
+def test_transitive_queries_with_loop():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.add('b', 'a')
+    with pytest.raises(DependencyLoop):
+        solver.transitive_dependencies('a')
+
+
+def test_solve_levels():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.add('a', 'c')
+    solver.add('b', 'd')
+    solver.add('c', 'd')
+    solver.add('e')
+    levels = solver.solve_levels()
+    assert [sorted(level) for level in levels] == [
+        ['d', 'e'], ['b', 'c'], ['a']]
+    assert DependencySolver().solve_levels() == []
+
+
+def test_schedule():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.add('a', 'c')
+    solver.add('b', 'c')
+    schedule = solver.schedule()
+    assert schedule.ready() == ['c']
+    assert schedule.ready() == []
+    assert not schedule.finished
+    assert schedule.done('c') == ['b']
+    with pytest.raises(ValueError):
+        schedule.done('c')
+    with pytest.raises(ValueError):
+        schedule.done('a')
+    assert schedule.done('b') == ['a']
+    assert schedule.done('a') == []
+    assert schedule.finished
+
+
+def test_all_loops():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.add('b', 'a')
+    solver.add('c', 'd')
+    solver.add('d', 'e')
+    solver.add('e', 'c')
+    solver.add('e', 'f')
+    solver.add('g', 'g')
+    solver.add('h', 'a')
+    with pytest.raises(DependencyLoop) as excinfo:
+        solver.solve()
+    exc = excinfo.value
+    assert exc.loops == [['a', 'b'], ['c', 'd', 'e'], ['g']]
+    assert exc.loop == ['a', 'b', 'a']
+    assert 'c, d, e' in str(exc)
+
+
+def test_deep_loop():
+    solver = DependencySolver()
+    count = 5000
+    for i in range(count):
+        solver.add('m%d' % i, 'm%d' % ((i + 1) % count))
+    with pytest.raises(DependencyLoop) as excinfo:
+        solver.solve()
+    assert len(excinfo.value.loops) == 1
+    assert len(excinfo.value.loops[0]) == count
+    assert len(excinfo.value.loop) == count + 1
+
+
+def test_removed_undeclared_dependency():
+    solver = DependencySolver()
+    solver.add('a', 'b')
+    solver.add('c')
+    assert solver.solve() == ['c', 'b', 'a']
+    solver.remove_dependency('a', 'b')
+    assert solver.solve() == ['a', 'c']
+    assert not solver.has_direct_dependency('a', 'b')
+    assert solver.transitive_dependents('b') == []
+
+
+def test_remaining_path_lengths():
+    solver = DependencySolver()
+    solver.add('b', 'a')
+    solver.add('c', 'a')
+    solver.add('d', 'c')
+    lengths = solver.remaining_path_lengths({'a': 1, 'b': 5, 'c': 2, 'd': 2})
+    assert lengths == {'a': 6, 'b': 5, 'c': 4, 'd': 2}
+
+
+def test_critical_path():
+    solver = DependencySolver()
+    solver.add('b', 'a')
+    solver.add('c', 'a')
+    solver.add('d', 'c')
+    solver.add('e')
+    assert solver.critical_path({'a': 1, 'b': 5, 'c': 2, 'd': 2, 'e': 3}) \
+        == (6, ['a', 'b'])
+    assert solver.critical_path({'c': 2, 'd': 2, 'e': 3}) == \
+        (4, ['a', 'c', 'd'])
+    assert DependencySolver().critical_path({}) == (0, [])
@@ -1,6 +1,20 @@
+import asyncio
+import gc
+import importlib
+import inspect
+import json
+import logging
+import os
 import pytest
+import sys
+import threading
+import time
+import tracemalloc
 from score.init import (
-    init, ConfiguredScore, ConfiguredModule, InitializationError)
+    init, init_async, init_prefork, init_from_file, critical_path,
+    ConfiguredScore, ConfiguredModule, InitializationError, ConfigurationError,
+    DependencySolver, DependencyLoop)
+from score.init.initializer import _process, _preimport_candidates
 
 
 def test_empty():
@@ -63,3 +77,836 @@ def test_missing_dependency():
                 'modules': 'test.initializer.missing_dependency'
             }
         })
+
+
+def test_parallel_success():
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.parallel.third\n'
+                'test.initializer.parallel.first\n'
+                'test.initializer.parallel.second',
+            'workers': '2',
+        }
+    })
+    assert isinstance(conf, ConfiguredScore)
+    assert list(conf._modules) == ['first', 'second', 'third']
+    assert conf.third._module_name == 'test.initializer.parallel.third'
+    assert conf.first._finalized
+    assert conf.second._finalized
+    assert conf.third._finalized
+
+
+def test_parallel_failure():
+    with pytest.raises(ValueError):
+        init({
+            'score.init': {
+                'modules':
+                    'test.initializer.parallel.failing\n'
+                    'test.initializer.parallel.first\n'
+                    'test.initializer.parallel.second',
+            }
+        }, workers=2)
+
+
+def test_async_success():
+    conf = asyncio.run(init_async({
+        'score.init': {
+            'modules':
+                'test.initializer.async_modules.first\n'
+                'test.initializer.async_modules.second\n'
+                'test.initializer.async_modules.third',
+        }
+    }))
+    assert isinstance(conf, ConfiguredScore)
+    assert list(conf._modules) == ['first', 'second', 'third']
+    assert conf.third._finalized
+    assert conf.third.finalize_awaited
+
+
+def test_async_no_side_effects_before_await():
+    assert inspect.iscoroutinefunction(init_async)
+    assert not tracemalloc.is_tracing()
+    coroutine = init_async({
+        'score.init': {
+            'modules': 'test.initializer.async_modules.first',
+            'profile_memory': 'true',
+        }
+    })
+    assert not tracemalloc.is_tracing()
+    coroutine.close()
+
+
+def test_async_module_in_sync_init():
+    with pytest.raises(InitializationError):
+        init({
+            'score.init': {
+                'modules': 'test.initializer.async_modules.first',
+            }
+        })
+
+
+@pytest.mark.parametrize('manifest', [False, True])
+def test_import_error(tmpdir, monkeypatch, manifest):
+    # the package is created on the fly, as pytest would fail importing it
+    # from the test folder
+    package = tmpdir.mkdir('broken_on_import')
+    package.join('__init__.py').write(
+        'raise RuntimeError("broken on import")\n')
+    if manifest:
+        package.join('__score__').write('')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    _forget_modules('broken_on_import')
+    with pytest.raises(RuntimeError, match='broken on import'):
+        init({
+            'score.init': {
+                'modules': 'broken_on_import',
+            }
+        })
+
+
+def test_lazy():
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.dependency_success.pkg1\n'
+                'test.initializer.dependency_success.pkg2\n'
+                'test.initializer.single_module_success',
+            'lazy': 'true',
+        }
+    })
+    assert isinstance(conf, ConfiguredScore)
+    assert not conf._modules
+    mod1 = conf.pkg1
+    assert isinstance(mod1, ConfiguredModule)
+    assert mod1._finalized
+    assert list(conf._modules) == ['pkg2', 'pkg1']
+    assert conf._modules['pkg2']._finalized
+    assert conf.pkg1 is mod1
+    assert 'single_module_success' not in conf._modules
+    with pytest.raises(AttributeError):
+        conf.nonexistent
+
+
+def test_lazy_concurrent_access():
+    import threading
+    from test.initializer.slow_finalize import started, release
+    conf = init({
+        'score.init': {
+            'modules': 'test.initializer.slow_finalize',
+            'lazy': 'true',
+        }
+    })
+    loader = threading.Thread(target=lambda: conf.slow_finalize)
+    loader.start()
+    assert started.wait(5)
+    results = []
+    reader = threading.Thread(
+        target=lambda: results.append(conf.slow_finalize._finalized))
+    reader.start()
+    release.set()
+    loader.join(5)
+    reader.join(5)
+    assert results == [True]
+
+
+def test_init_report(caplog):
+    caplog.set_level(logging.INFO, logger='score.init')
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.dependency_success.pkg1\n'
+                'test.initializer.dependency_success.pkg2',
+            'report': 'true',
+        }
+    })
+    report = conf._init_report
+    assert list(report.modules) == ['pkg1', 'pkg2']
+    for alias in ('pkg1', 'pkg2'):
+        record = report.modules[alias]
+        assert record.import_time >= 0
+        assert record.init_time >= 0
+        assert record.init_cpu_time >= 0
+        assert record.finalize_time >= 0
+    assert report.modules['pkg1'].init_wait_time >= \
+        report.modules['pkg2'].init_wait_time
+    assert 'pkg1' in report.summary()
+    assert 'Initialization report' in caplog.text
+
+
+def test_init_trace(tmpdir):
+    file = str(tmpdir.join('trace.json'))
+    init({
+        'score.init': {
+            'modules':
+                'test.initializer.dependency_success.pkg1\n'
+                'test.initializer.dependency_success.pkg2',
+            'trace': file,
+        }
+    })
+    with open(file) as fp:
+        events = json.load(fp)['traceEvents']
+    names = set(event['name'] for event in events if event['ph'] == 'X')
+    assert names == {'import pkg1', 'import pkg2', 'init pkg1', 'init pkg2',
+                     'finalize pkg1', 'finalize pkg2'}
+    flows = [event for event in events if event['ph'] in 'sf']
+    assert len(flows) == 2
+
+
+def test_lazy_trace(tmpdir):
+    file = str(tmpdir.join('trace.json'))
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.dependency_success.pkg1\n'
+                'test.initializer.dependency_success.pkg2',
+            'trace': file,
+            'lazy': 'true',
+        }
+    })
+    assert not os.path.exists(file)
+    conf.pkg2
+    with open(file) as fp:
+        events = json.load(fp)['traceEvents']
+    names = set(event['name'] for event in events if event['ph'] == 'X')
+    assert 'init pkg2' in names
+    assert 'init pkg1' not in names
+    conf.pkg1
+    with open(file) as fp:
+        events = json.load(fp)['traceEvents']
+    names = set(event['name'] for event in events if event['ph'] == 'X')
+    assert 'init pkg1' in names
+
+
+def test_profile_imports(caplog):
+    caplog.set_level(logging.INFO, logger='score.init')
+    sys.modules.pop('test.initializer.profiled', None)
+    sys.modules.pop('test.initializer.profiled.nested', None)
+    conf = init({
+        'score.init': {
+            'modules': 'test.initializer.profiled',
+            'profile_imports': 'true',
+            'report': 'true',
+        }
+    })
+    imports = conf._init_report.imports
+    alias, cumulative, self_time = \
+        imports['test.initializer.profiled.nested']
+    assert alias == 'profiled'
+    assert self_time >= 0.01
+    alias, cumulative, self_time = imports['test.initializer.profiled']
+    assert alias == 'profiled'
+    assert cumulative >= 0.01
+    assert self_time < cumulative
+    module = sys.modules['test.initializer.profiled']
+    assert module.__spec__.loader is module.__loader__
+    assert type(module.__loader__).__name__ != '_TimingLoader'
+    assert 'Slowest imports' in caplog.text
+
+
+def test_profile_imports_concurrent(tmpdir, monkeypatch):
+    from score.init.report import InitReport, _ImportProfiler
+    monkeypatch.syspath_prepend(str(tmpdir))
+    for name in ('profiled_first', 'profiled_second'):
+        tmpdir.join(name + '.py').write('import time\ntime.sleep(0.02)\n')
+    report = InitReport(profile_imports=True)
+    barrier = threading.Barrier(2)
+    profilers = []
+
+    def load(alias):
+        with report.profiling_imports(alias):
+            barrier.wait()
+            profilers.append(sum(isinstance(finder, _ImportProfiler)
+                                 for finder in sys.meta_path))
+            importlib.import_module('profiled_' + alias)
+            barrier.wait()
+
+    threads = [threading.Thread(target=load, args=(alias,))
+               for alias in ('first', 'second')]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        _forget_modules('profiled_first', 'profiled_second')
+    assert profilers == [1, 1]
+    assert not any(isinstance(finder, _ImportProfiler)
+                   for finder in sys.meta_path)
+    for alias in ('first', 'second'):
+        imported_by, cumulative, self_time = \
+            report.imports['profiled_' + alias]
+        assert imported_by == alias
+        assert self_time == cumulative
+
+
+def test_profile_memory():
+    assert not tracemalloc.is_tracing()
+    conf = init({
+        'score.init': {
+            'modules': 'test.initializer.memory_hog',
+            'profile_memory': 'true',
+        }
+    })
+    record = conf._init_report.modules['memory_hog']
+    size, count = record.init_memory
+    assert size >= 1024 * 1024
+    assert count >= 1
+    assert record.import_memory is not None
+    assert record.finalize_memory is not None
+    assert not tracemalloc.is_tracing()
+    assert 'memory_hog' in conf._init_report.memory_summary()
+
+
+def test_dependency_cache(tmpdir, monkeypatch):
+    confdict = {
+        'score.init': {
+            'modules':
+                'test.initializer.dependency_success.pkg1\n'
+                'test.initializer.dependency_success.pkg2',
+            'cachedir': str(tmpdir),
+        }
+    }
+    init(confdict)
+    with open(str(tmpdir.join('dependencies.json'))) as fp:
+        entries = json.load(fp)
+    assert [['pkg2', False]] in (entry['dependencies']
+                                 for entry in entries.values())
+
+    def fail(*args):
+        raise AssertionError('signature inspected despite cache')
+
+    monkeypatch.setattr('score.init.cache._inspect', fail)
+    conf = init(confdict)
+    assert list(conf._modules) == ['pkg2', 'pkg1']
+
+
+def test_dependency_cache_decorated(tmpdir, monkeypatch):
+    from score.init.cache import DependencyCache
+    monkeypatch.syspath_prepend(str(tmpdir))
+    tmpdir.join('cache_decorator.py').write(
+        'import functools\n'
+        'def decorate(func):\n'
+        '    @functools.wraps(func)\n'
+        '    def wrapper(*args, **kwargs):\n'
+        '        return func(*args, **kwargs)\n'
+        '    return wrapper\n')
+    module = tmpdir.join('cache_decorated.py')
+    module.write('from cache_decorator import decorate\n'
+                 '@decorate\n'
+                 'def init(confdict, dep):\n'
+                 '    pass\n')
+    _forget_modules('cache_decorator', 'cache_decorated')
+    import cache_decorated
+    cache = DependencyCache(str(tmpdir.join('dependencies.json')))
+    assert cache.dependencies(cache_decorated.init, skip=1) == \
+        [('dep', False)]
+    cache.save()
+    module.write('from cache_decorator import decorate\n'
+                 '@decorate\n'
+                 'def init(confdict):\n'
+                 '    pass\n')
+    _forget_modules('cache_decorated')
+    import cache_decorated
+    cache = DependencyCache(str(tmpdir.join('dependencies.json')))
+    assert cache.dependencies(cache_decorated.init, skip=1) == []
+    _forget_modules('cache_decorator', 'cache_decorated')
+
+
+def test_critical_path(tmpdir):
+    confdict = {
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.dependent\n'
+                'test.initializer.reinit.other',
+            'cachedir': str(tmpdir),
+        }
+    }
+    init(confdict)
+    with open(str(tmpdir.join('timings.json'))) as fp:
+        assert set(json.load(fp)) == {'base', 'dependent', 'other'}
+    with open(str(tmpdir.join('timings.json')), 'w') as fp:
+        json.dump({'base': 1.0, 'dependent': 2.0, 'other': 2.5}, fp)
+    assert critical_path(confdict) == (3.0, ['base', 'dependent'])
+
+
+def test_prioritized_processing():
+    solver = DependencySolver()
+    for node in ('a', 'b', 'c'):
+        solver.add(node)
+    started = []
+
+    def callback(node, results):
+        started.append(node)
+
+    _process(solver, callback, 2, priorities={'a': 1, 'b': 2, 'c': 3})
+    assert set(started[:2]) == {'b', 'c'}
+    assert started[2] == 'a'
+
+
+def _forget_modules(*names):
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+def test_concurrent_finalize():
+    import threading
+    from test.initializer.slow_finalize import started, release
+    started.clear()
+    release.clear()
+    conf = init({
+        'score.init': {
+            'modules': 'test.initializer.slow_finalize',
+        }
+    }, finalize=False)
+    first = threading.Thread(target=conf._finalize)
+    first.start()
+    assert started.wait(5)
+    results = []
+    second = threading.Thread(target=lambda: (
+        conf._finalize(),
+        results.append(conf.slow_finalize._finalized)))
+    second.start()
+    time.sleep(0.1)
+    assert not results
+    release.set()
+    first.join(5)
+    second.join(5)
+    assert results == [True]
+    assert conf.slow_finalize.finalize_calls == 1
+
+
+def test_manifest():
+    _forget_modules('test.initializer.manifest.alpha',
+                    'test.initializer.manifest.beta')
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.manifest.alpha\n'
+                'test.initializer.manifest.beta',
+        }
+    })
+    assert list(conf._modules) == ['beta', 'alpha']
+    assert conf.alpha.finalized_with is conf.beta
+    report = conf._init_report
+    assert report.modules['alpha'].spans['import'][0] > \
+        report.modules['beta'].spans['init'][0]
+
+
+def test_manifest_lazy():
+    _forget_modules('test.initializer.manifest.alpha',
+                    'test.initializer.manifest.beta')
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.manifest.alpha\n'
+                'test.initializer.manifest.beta',
+            'lazy': 'true',
+        }
+    })
+    assert 'test.initializer.manifest.alpha' not in sys.modules
+    assert 'test.initializer.manifest.beta' not in sys.modules
+    assert conf.beta._finalized
+    assert 'test.initializer.manifest.alpha' not in sys.modules
+
+
+def test_manifest_loop():
+    _forget_modules('test.initializer.manifest.loop1',
+                    'test.initializer.manifest.loop2')
+    with pytest.raises(DependencyLoop):
+        init({
+            'score.init': {
+                'modules':
+                    'test.initializer.manifest.loop1\n'
+                    'test.initializer.manifest.loop2',
+            }
+        })
+    assert 'test.initializer.manifest.loop1' not in sys.modules
+    assert 'test.initializer.manifest.loop2' not in sys.modules
+
+
+def test_manifest_mismatch():
+    _forget_modules('test.initializer.manifest.stale',
+                    'test.initializer.manifest.beta')
+    with pytest.raises(ConfigurationError) as excinfo:
+        init({
+            'score.init': {
+                'modules':
+                    'test.initializer.manifest.stale\n'
+                    'test.initializer.manifest.beta',
+            }
+        })
+    message = str(excinfo.value)
+    assert os.path.join('manifest', 'stale', '__score__') in message
+    assert 'gamma (optional)' in message
+
+
+def test_manifest_loop_lazy():
+    _forget_modules('test.initializer.manifest.loop1',
+                    'test.initializer.manifest.loop2')
+    with pytest.raises(DependencyLoop):
+        init({
+            'score.init': {
+                'modules':
+                    'test.initializer.manifest.loop1\n'
+                    'test.initializer.manifest.loop2',
+                'lazy': 'true',
+            }
+        })
+    assert 'test.initializer.manifest.loop1' not in sys.modules
+
+
+def test_init_prefork():
+    conf = init_prefork({
+        'score.init': {
+            'modules': 'test.initializer.forking',
+        }
+    })
+    try:
+        assert gc.get_freeze_count() > 0
+        read, write = os.pipe()
+        pid = os.fork()
+        if not pid:
+            os.write(write, b'1' if conf.forking.forked else b'0')
+            os._exit(0)
+        os.close(write)
+        assert os.read(read, 1) == b'1'
+        os.waitpid(pid, 0)
+        assert not conf.forking.forked
+    finally:
+        gc.unfreeze()
+
+
+def test_init_prefork_releases_score():
+    import weakref
+    confdict = {
+        'score.init': {
+            'modules': 'test.initializer.forking',
+        }
+    }
+    try:
+        first = weakref.ref(init_prefork(confdict))
+        conf = init_prefork(confdict)
+    finally:
+        gc.unfreeze()
+    gc.collect()
+    assert first() is None
+    read, write = os.pipe()
+    pid = os.fork()
+    if not pid:
+        os.write(write, b'1' if conf.forking.forked else b'0')
+        os._exit(0)
+    os.close(write)
+    assert os.read(read, 1) == b'1'
+    os.waitpid(pid, 0)
+
+
+def test_init_prefork_background():
+    from test.initializer.background import release
+    release.set()
+    conf = init_prefork({
+        'score.init': {
+            'modules':
+                'test.initializer.background.slow:slow(background)\n'
+                'test.initializer.forking',
+        }
+    })
+    try:
+        assert 'slow' in conf.__dict__
+        assert conf.slow._finalized
+    finally:
+        gc.unfreeze()
+
+
+def test_init_prefork_unsupported(monkeypatch):
+    monkeypatch.delattr(gc, 'freeze')
+    with pytest.raises(InitializationError):
+        init_prefork({
+            'score.init': {
+                'modules': 'test.initializer.forking',
+            }
+        })
+
+
+def test_init_prefork_lazy():
+    with pytest.raises(ConfigurationError):
+        init_prefork({
+            'score.init': {
+                'modules': 'test.initializer.forking',
+            }
+        }, lazy=True)
+
+
+def test_confdict_copy():
+    confdict = {
+        'score.init': {
+            'modules': 'test.initializer.reinit.base',
+        },
+        'base': {'value': '1'},
+    }
+    conf = init(confdict)
+    confdict['base']['value'] = '2'
+    confdict['base']['other'] = '3'
+    confdict['new'] = {'value': '4'}
+    assert dict(conf.conf['base']) == {'value': '1'}
+    assert 'new' not in conf.conf
+    assert conf.reinit(confdict) == ['base']
+    assert conf.base.confdict == {'value': '2', 'other': '3'}
+    assert conf.conf['new']['value'] == '4'
+
+
+def test_reinit():
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.dependent\n'
+                'test.initializer.reinit.other',
+        },
+        'base': {'value': '1'},
+        'other': {'value': '1'},
+    })
+    base, dependent, other = conf.base, conf.dependent, conf.other
+    reinitialized = conf.reinit({
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.dependent\n'
+                'test.initializer.reinit.other',
+        },
+        'base': {'value': '2'},
+        'other': {'value': '1'},
+    })
+    assert reinitialized == ['base', 'dependent']
+    assert conf.base is not base
+    assert conf.base.confdict == {'value': '2'}
+    assert conf.base._finalized
+    assert conf.dependent is not dependent
+    assert conf.dependent.dependencies['base'] is conf.base
+    assert conf.dependent._finalized
+    assert conf.other is other
+    assert conf._modules['other'] is other
+
+
+def test_reinit_subsection():
+    confdict = {
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.other',
+        },
+        'other:sub': {'value': '1'},
+    }
+    conf = init(_copy_confdict(confdict))
+    assert conf.reinit(_copy_confdict(confdict)) == []
+    confdict['other:sub']['value'] = '2'
+    assert conf.reinit(_copy_confdict(confdict)) == ['other']
+    assert conf.other.confdict == {'sub.value': '2'}
+
+
+def test_reinit_failure():
+    from test.initializer.reinit import flaky
+    confdict = {
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.flaky',
+        },
+        'flaky': {'value': '1'},
+    }
+    conf = init(_copy_confdict(confdict))
+    previous = conf.flaky
+    confdict['flaky']['value'] = '2'
+    flaky.failures = 1
+    with pytest.raises(ValueError):
+        conf.reinit(_copy_confdict(confdict))
+    assert conf.conf['flaky']['value'] == '1'
+    assert conf.flaky is previous
+    assert conf._modules['flaky'] is previous
+    assert conf.reinit(_copy_confdict(confdict)) == ['flaky']
+    assert conf.flaky.confdict == {'value': '2'}
+    assert conf.flaky._finalized
+
+
+def _copy_confdict(confdict):
+    return dict((section, dict(values))
+                for section, values in confdict.items())
+
+
+def test_reinit_changed_modules():
+    conf = init({
+        'score.init': {
+            'modules': 'test.initializer.reinit.base',
+        },
+    })
+    with pytest.raises(ConfigurationError):
+        conf.reinit({
+            'score.init': {
+                'modules':
+                    'test.initializer.reinit.base\n'
+                    'test.initializer.reinit.other',
+            },
+        })
+
+
+def test_init_only():
+    _forget_modules('test.initializer.reinit.other')
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.dependent\n'
+                'test.initializer.reinit.other',
+        },
+    }, only=['dependent'])
+    assert list(conf._modules) == ['base', 'dependent']
+    assert conf.dependent.dependencies['base'] is conf.base
+    assert conf.dependent._finalized
+    assert not hasattr(conf, 'other')
+    assert 'test.initializer.reinit.other' not in sys.modules
+
+
+def test_init_only_string():
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.dependent\n'
+                'test.initializer.reinit.other',
+        },
+    }, only='dependent')
+    assert list(conf._modules) == ['base', 'dependent']
+
+
+def test_init_only_confkey():
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.dependent\n'
+                'test.initializer.reinit.other',
+            'only': 'other',
+        },
+    })
+    assert list(conf._modules) == ['other']
+
+
+def test_init_only_unknown():
+    with pytest.raises(ConfigurationError):
+        init({
+            'score.init': {
+                'modules': 'test.initializer.reinit.base',
+            },
+        }, only=['other'])
+
+
+def test_background():
+    from test.initializer.background import release
+    release.clear()
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.background.slow:slow(background)\n'
+                'test.initializer.background.dependent\n'
+                'test.initializer.reinit.base',
+        },
+    })
+    assert list(conf._modules) == ['base']
+    assert conf.base._finalized
+    release.set()
+    assert conf.dependent.dependencies['slow'] is conf.slow
+    assert conf.slow._finalized
+    assert conf.dependent._finalized
+    assert set(conf._modules) == {'slow', 'dependent', 'base'}
+
+
+def test_background_failure():
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.background.failing:failing(background)\n'
+                'test.initializer.reinit.base',
+            'profile_memory': 'true',
+        },
+    })
+    assert conf.base._finalized
+    with pytest.raises(ValueError):
+        conf.failing
+    # the report is published once the background thread is done
+    for _ in range(100):
+        if not tracemalloc.is_tracing():
+            break
+        time.sleep(0.05)
+    assert not tracemalloc.is_tracing()
+
+
+def test_background_per_module():
+    from test.initializer.background import release
+    release.clear()
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.background.slow:slow(background)\n'
+                'test.initializer.background.dependent\n'
+                'test.initializer.background.failing:failing(background)\n'
+                'test.initializer.background.fast:fast(background)',
+        },
+    })
+    try:
+        assert conf.fast._finalized
+        with pytest.raises(ValueError):
+            conf.failing
+        assert not release.is_set()
+    finally:
+        release.set()
+    assert conf.dependent.dependencies['slow'] is conf.slow
+    assert conf.slow._finalized
+    assert set(conf._modules) == {'slow', 'dependent', 'fast'}
+
+
+def test_init_from_file_preimport():
+    _forget_modules('test.initializer.reinit.dependent')
+    conf = init_from_file(
+        os.path.join(os.path.dirname(__file__), 'preimport', 'main.conf'),
+        init_logging=False, preimport=True)
+    assert list(conf._modules) == ['base', 'dependent']
+    assert conf.dependent.dependencies['base'] is conf.base
+
+
+def test_preimport_candidates():
+    assert _preimport_candidates('\n  a\n  b') == ['a', 'b']
+    assert _preimport_candidates('<diff>\n -a\n +b\n c') == ['b', 'c']
+    assert _preimport_candidates('<replace:a:b>') == []
+    assert _preimport_candidates('a\n${b}') == ['a']
+
+
+def test_overrides_are_layered():
+    confdict = {
+        'score.init': {
+            'modules': 'test.initializer.reinit.base',
+        },
+        'base': {'value': '1'},
+        'base:sub': {'value': '2'},
+    }
+    conf = init(confdict, overrides={'base': {'value': '3'}})
+    assert conf.base.confdict == {'value': '3', 'sub.value': '2'}
+    assert confdict['base'] == {'value': '1'}
+    assert conf.conf['base']['value'] == '3'
+
+
+def test_subsections_leave_conf_untouched():
+    conf = init({
+        'score.init': {
+            'modules':
+                'test.initializer.reinit.base\n'
+                'test.initializer.reinit.other',
+        },
+        'base': {'value': '1'},
+        'base:sub': {'value': '2'},
+        'other:sub:deep': {'value': '3'},
+    })
+    assert conf.base.confdict == {'value': '1', 'sub.value': '2'}
+    assert conf.other.confdict == {'sub:deep.value': '3'}
+    assert dict(conf.conf['base']) == {'value': '1'}
+    assert 'other' not in conf.conf
@@ -0,0 +1,4 @@
+import asyncio
+
+first_started = asyncio.Event()
+second_started = asyncio.Event()
@@ -0,0 +1,9 @@
+import asyncio
+from score.init import ConfiguredModule
+from . import first_started, second_started
+
+
+async def init(confdict):
+    first_started.set()
+    await asyncio.wait_for(second_started.wait(), 5)
+    return ConfiguredModule(__name__)
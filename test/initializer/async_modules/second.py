@@ -0,0 +1,9 @@
+import asyncio
+from score.init import ConfiguredModule
+from . import first_started, second_started
+
+
+async def init(confdict):
+    second_started.set()
+    await asyncio.wait_for(first_started.wait(), 5)
+    return ConfiguredModule(__name__)
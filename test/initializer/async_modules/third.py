@@ -0,0 +1,15 @@
+import asyncio
+from score.init import ConfiguredModule
+
+
+class ConfiguredThirdModule(ConfiguredModule):
+
+    finalize_awaited = False
+
+    async def _finalize(self):
+        await asyncio.sleep(0)
+        self.finalize_awaited = True
+
+
+def init(confdict, first, second):
+    return ConfiguredThirdModule(__name__)
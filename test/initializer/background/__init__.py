@@ -0,0 +1,12 @@
+import threading
+from score.init import ConfiguredModule
+
+
+release = threading.Event()
+
+
+class ConfiguredBackgroundModule(ConfiguredModule):
+
+    def __init__(self, module, **dependencies):
+        super().__init__(module)
+        self.dependencies = dependencies
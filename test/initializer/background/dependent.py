@@ -0,0 +1,5 @@
+from . import ConfiguredBackgroundModule
+
+
+def init(confdict, slow):
+    return ConfiguredBackgroundModule(__name__, slow=slow)
@@ -0,0 +1,2 @@
+def init(confdict):
+    raise ValueError('failing')
@@ -0,0 +1,5 @@
+from . import ConfiguredBackgroundModule
+
+
+def init(confdict):
+    return ConfiguredBackgroundModule(__name__)
@@ -0,0 +1,6 @@
+from . import release, ConfiguredBackgroundModule
+
+
+def init(confdict):
+    assert release.wait(5)
+    return ConfiguredBackgroundModule(__name__)
@@ -54,3 +54,26 @@ def test_longer_cycle():
         _sort_modules({'a': ['b'], 'b': ['c'], 'c': ['a']}, dict(), None)
     exc = excinfo.value
     assert set(exc.loop) == {'a', 'b', 'c'}
+
+
+def test_undeclared_dependency():
+    result = _sort_modules({'a': ['c'], 'b': ['c']}, dict(), 'testing')
+    assert sorted(result) == ['a', 'b', 'c']
+    assert result.index('c') < result.index('a')
+    assert result.index('c') < result.index('b')
+
+
+def test_long_chain():
+    count = 5000
+    result = _sort_modules(
+        dict(('m%d' % i, ['m%d' % (i + 1)] if i + 1 < count else [])
+             for i in range(count)),
+        dict(), 'testing')
+    assert result == ['m%d' % i for i in reversed(range(count))]
+
+
+def test_cycle_with_tail():
+    with pytest.raises(DependencyLoop) as excinfo:
+        _sort_modules({'x': ['a'], 'a': ['b'], 'b': ['a']}, dict(), None)
+    exc = excinfo.value
+    assert set(exc.loop) == {'a', 'b'}
@@ -0,0 +1,13 @@
+from score.init import ConfiguredModule
+
+
+class ConfiguredForkingModule(ConfiguredModule):
+
+    forked = False
+
+    def _after_fork(self):
+        self.forked = True
+
+
+def init(confdict):
+    return ConfiguredForkingModule(__package__)
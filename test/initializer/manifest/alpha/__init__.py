@@ -0,0 +1,12 @@
+from score.init import ConfiguredModule
+
+
+class ConfiguredAlphaModule(ConfiguredModule):
+
+    def _finalize(self, *, beta):
+        assert beta._finalized
+        self.finalized_with = beta
+
+
+def init(confdict, beta):
+    return ConfiguredAlphaModule(__package__)
@@ -0,0 +1,2 @@
+def init(confdict, loop2):
+    pass
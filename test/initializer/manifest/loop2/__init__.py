@@ -0,0 +1,2 @@
+def init(confdict, loop1):
+    pass
@@ -0,0 +1,5 @@
+from score.init import ConfiguredModule
+
+
+def init(confdict, beta):
+    return ConfiguredModule(__package__)
@@ -0,0 +1,12 @@
+from score.init import ConfiguredModule
+
+
+class ConfiguredMemoryHogModule(ConfiguredModule):
+
+    def __init__(self):
+        super().__init__(__package__)
+        self.data = bytearray(1024 * 1024)
+
+
+def init(confdict):
+    return ConfiguredMemoryHogModule()
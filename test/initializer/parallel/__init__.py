@@ -0,0 +1,11 @@
+import threading
+from score.init import ConfiguredModule
+
+barrier = threading.Barrier(2, timeout=5)
+finalize_barrier = threading.Barrier(2, timeout=5)
+
+
+class ConfiguredParallelModule(ConfiguredModule):
+
+    def _finalize(self):
+        finalize_barrier.wait()
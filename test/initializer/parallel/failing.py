@@ -0,0 +1,2 @@
+def init(confdict, first):
+    raise ValueError('failing on purpose')
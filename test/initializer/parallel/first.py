@@ -0,0 +1,6 @@
+from . import barrier, ConfiguredParallelModule
+
+
+def init(confdict):
+    barrier.wait()
+    return ConfiguredParallelModule(__name__)
@@ -0,0 +1,7 @@
+from score.init import ConfiguredModule
+
+
+def init(confdict, first, second):
+    assert first._module_name == 'test.initializer.parallel.first'
+    assert second._module_name == 'test.initializer.parallel.second'
+    return ConfiguredModule(__name__)
@@ -0,0 +1,99 @@
+import json
+import os
+import pytest
+from score.init import (
+    compile_plan, init_from_plan, ConfiguredScore, ConfigurationError)
+
+
+def _write_conf(tmpdir, modules, name='app.conf'):
+    file = str(tmpdir.join(name))
+    with open(file, 'w') as fp:
+        fp.write('[score.init]\nmodules =\n')
+        for module in modules:
+            fp.write('    %s\n' % module)
+    return file
+
+
+def test_compile_and_load(tmpdir, monkeypatch):
+    file = _write_conf(tmpdir, [
+        'test.initializer.dependency_success.pkg1',
+        'test.initializer.dependency_success.pkg2',
+    ])
+    planfile = str(tmpdir.join('app.plan'))
+    compile_plan(file, planfile)
+    assert os.path.isfile(planfile)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('configuration parsed despite plan')
+
+    monkeypatch.setattr('score.init.plan.init_from_file', fail)
+    monkeypatch.setattr('score.init.initializer._collect_dependencies', fail)
+    conf = init_from_plan(planfile)
+    assert isinstance(conf, ConfiguredScore)
+    assert list(conf._modules) == ['pkg2', 'pkg1']
+    assert conf.pkg1._finalized
+    assert conf.pkg2._finalized
+
+
+def test_stale_plan(tmpdir):
+    file = _write_conf(tmpdir, [
+        'test.initializer.dependency_success.pkg1',
+        'test.initializer.dependency_success.pkg2',
+    ])
+    planfile = str(tmpdir.join('app.plan'))
+    compile_plan(file, planfile)
+    _write_conf(tmpdir, ['test.initializer.single_module_success'])
+    with pytest.raises(ConfigurationError):
+        init_from_plan(planfile)
+    conf = init_from_plan(planfile, file)
+    assert list(conf._modules) == ['single_module_success']
+    conf = init_from_plan(planfile)
+    assert list(conf._modules) == ['single_module_success']
+
+
+def test_missing_plan(tmpdir):
+    file = _write_conf(tmpdir, ['test.initializer.single_module_success'])
+    planfile = str(tmpdir.join('app.plan'))
+    conf = init_from_plan(planfile, file)
+    assert list(conf._modules) == ['single_module_success']
+    assert os.path.isfile(planfile)
+
+
+def test_missing_plan_without_finalize(tmpdir, monkeypatch):
+    file = _write_conf(tmpdir, [
+        'test.initializer.dependency_success.pkg1',
+        'test.initializer.dependency_success.pkg2',
+    ])
+    planfile = str(tmpdir.join('app.plan'))
+    conf = init_from_plan(planfile, file, finalize=False)
+    assert not conf.pkg1._finalized
+    assert os.path.isfile(planfile)
+    monkeypatch.setattr('score.init.plan.init',
+                        lambda *args, **kwargs: pytest.fail('plan unused'))
+    conf = init_from_plan(planfile, file, finalize=False)
+    assert list(conf._modules) == ['pkg2', 'pkg1']
+    assert not conf.pkg1._finalized
+
+
+def test_plan_of_other_file(tmpdir):
+    file = _write_conf(tmpdir, ['test.initializer.single_module_success'])
+    other = _write_conf(tmpdir, [
+        'test.initializer.dependency_success.pkg1',
+        'test.initializer.dependency_success.pkg2',
+    ], 'other.conf')
+    planfile = str(tmpdir.join('app.plan'))
+    compile_plan(file, planfile)
+    conf = init_from_plan(planfile, other)
+    assert list(conf._modules) == ['pkg2', 'pkg1']
+
+
+def test_plan_sources_contain_init_file(tmpdir):
+    file = _write_conf(tmpdir, ['test.initializer.plan_impl'])
+    planfile = str(tmpdir.join('app.plan'))
+    compile_plan(file, planfile)
+    with open(planfile) as fp:
+        sources = json.load(fp)['sources']
+    assert any(source.endswith(os.path.join('plan_impl', 'impl.py'))
+               for source in sources)
+    assert any(source.endswith(os.path.join('plan_impl', 'conf.py'))
+               for source in sources)
@@ -0,0 +1,10 @@
+from score.init import ConfiguredModule
+
+
+class ConfiguredPlanImplModule(ConfiguredModule):
+
+    def __init__(self):
+        super().__init__('test.initializer.plan_impl')
+
+    def _finalize(self):
+        pass
@@ -0,0 +1,5 @@
+from .conf import ConfiguredPlanImplModule
+
+
+def init(confdict):
+    return ConfiguredPlanImplModule()
@@ -0,0 +1,6 @@
+from score.init import ConfiguredModule
+from . import nested  # noqa
+
+
+def init(confdict):
+    return ConfiguredModule(__package__)
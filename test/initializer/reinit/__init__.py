@@ -0,0 +1,9 @@
+from score.init import ConfiguredModule
+
+
+class ConfiguredReinitModule(ConfiguredModule):
+
+    def __init__(self, module, confdict, **dependencies):
+        super().__init__(module)
+        self.confdict = dict(confdict)
+        self.dependencies = dependencies
@@ -0,0 +1,5 @@
+from . import ConfiguredReinitModule
+
+
+def init(confdict):
+    return ConfiguredReinitModule(__name__, confdict)
@@ -0,0 +1,5 @@
+from . import ConfiguredReinitModule
+
+
+def init(confdict, base):
+    return ConfiguredReinitModule(__name__, confdict, base=base)
@@ -0,0 +1,12 @@
+from . import ConfiguredReinitModule
+
+
+failures = 0
+
+
+def init(confdict):
+    global failures
+    if failures:
+        failures -= 1
+        raise ValueError('flaky')
+    return ConfiguredReinitModule(__name__, confdict)
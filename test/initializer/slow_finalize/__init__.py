@@ -0,0 +1,20 @@
+import threading
+from score.init import ConfiguredModule
+
+
+started = threading.Event()
+release = threading.Event()
+
+
+class ConfiguredSlowFinalizeModule(ConfiguredModule):
+
+    finalize_calls = 0
+
+    def _finalize(self):
+        self.finalize_calls += 1
+        started.set()
+        assert release.wait(5)
+
+
+def init(confdict):
+    return ConfiguredSlowFinalizeModule(__package__)
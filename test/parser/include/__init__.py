@@ -36,3 +36,11 @@ def test_based_on_and_include():
     print(conf['score.init']['modules'])
     assert parse_list(conf['score.init']['modules']) == (
         ['module1', 'module2', 'module3'])
+
+
+def test_listener():
+    files = []
+    parse(os.path.join(ROOT, 'based_on_and_include', 'main.conf'),
+          listener=files.append)
+    assert len(files) == 3
+    assert 'based_on' in files[0]['score.init']
@@ -0,0 +1,45 @@
+import os
+import pytest
+from score.init import parse_config_file as parse, ConfigView
+
+
+ROOT = os.path.dirname(__file__)
+
+
+def test_parse():
+    conf = parse(os.path.join(ROOT, 'main.conf'))
+    assert isinstance(conf, ConfigView)
+    assert list(conf) == ['spam', 'bacon']
+    assert dict(conf['spam']) == {'eggs': '3 eggs'}
+    assert 'here' not in conf['bacon']
+    with pytest.raises(TypeError):
+        conf['spam']['eggs'] = 'none'
+
+
+def test_layers():
+    base = {'spam': {'eggs': '1', 'bacon': '2'}}
+    view = ConfigView(base)
+    layered = view.layer({'spam': {'eggs': '3'}, 'ham': {'spam': '4'}})
+    assert dict(layered['spam']) == {'eggs': '3', 'bacon': '2'}
+    assert list(layered) == ['spam', 'ham']
+    assert dict(view['spam']) == {'eggs': '1', 'bacon': '2'}
+    assert base == {'spam': {'eggs': '1', 'bacon': '2'}}
+
+
+def test_prefixed():
+    view = ConfigView({'spam': {'eggs': '1'}})
+    section = view['spam'].prefixed('sub.')
+    assert dict(section) == {'sub.eggs': '1'}
+    assert 'eggs' not in section
+
+
+def test_subsections():
+    view = ConfigView({
+        'spam': {},
+        'spam:eggs': {},
+        'spammer:eggs': {},
+        'spam:bacon:ham': {},
+    })
+    assert view.subsections('spam') == ['spam:eggs', 'spam:bacon:ham']
+    assert view.subsections('spammer') == ['spammer:eggs']
+    assert view.subsections('eggs') == []